@@ -1,23 +1,82 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import logging
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import asyncio
+import logging
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from app.backend.routes import api_router
 from app.backend.database.connection import engine
 from app.backend.database.models import Base
-from app.backend.services.ollama_service import ollama_service
+from app.backend.services.ollama_service import get_ollama_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="AI Hedge Fund API", description="Backend API for AI Hedge Fund", version="0.1.0")
+# Serialize JSON responses with orjson when it is installed, falling back to the stdlib encoder
+app = FastAPI(
+    title="AI Hedge Fund API",
+    description="Backend API for AI Hedge Fund",
+    version="0.1.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
+)
 
 # Initialize database tables (this is safe to run multiple times)
 Base.metadata.create_all(bind=engine)
 
-# Configure CORS
+# Largest request body accepted; anything bigger is rejected before it is parsed
+MAX_REQUEST_BODY_SIZE = 2 * 1024 * 1024
+
+
+class RequestBodySizeLimitMiddleware:
+    """Reject request bodies larger than max_body_size with a 413.
+
+    A plain ASGI middleware rather than @app.middleware("http"), so long-lived streaming
+    responses pass straight through without the per-chunk overhead of BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reject a declared oversized body without reading any of it
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_size:
+            response = JSONResponse(status_code=413, content={"detail": "Request body too large"})
+            await response(scope, receive, send)
+            return
+
+        # Count the bytes actually received, for bodies sent without (or understating) Content-Length
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        await self.app(scope, receive_limited, send)
+
+
+app.add_middleware(RequestBodySizeLimitMiddleware, max_body_size=MAX_REQUEST_BODY_SIZE)
+
+# Configure CORS (added after the size check so rejected requests still carry CORS headers)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://127.0.0.1:5173"],  # Frontend URLs
@@ -32,9 +91,17 @@ app.include_router(api_router)
 @app.on_event("startup")
 async def startup_event():
     """Startup event to check Ollama availability."""
+    # The check shells out and probes the Ollama server, so run it in the background
+    # rather than holding up the API from accepting requests. Keep a reference so the
+    # task isn't garbage collected before it finishes.
+    app.state.ollama_status_task = asyncio.create_task(log_ollama_status())
+
+
+async def log_ollama_status():
+    """Log whether Ollama is installed and running, and which models are available."""
     try:
         logger.info("Checking Ollama availability...")
-        status = await ollama_service.check_ollama_status()
+        status = await get_ollama_service().check_ollama_status()
         
         if status["installed"]:
             if status["running"]:
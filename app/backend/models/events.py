@@ -7,10 +7,11 @@ class BaseEvent(BaseModel):
 
     type: str
 
-    def to_sse(self) -> str:
+    def to_sse(self) -> bytes:
         """Convert to Server-Sent Event format"""
-        event_type = self.type.lower()
-        return f"event: {event_type}\ndata: {self.model_dump_json()}\n\n"
+        event_type = self.type.lower().encode()
+        data = self.model_dump_json().encode()
+        return b"event: " + event_type + b"\ndata: " + data + b"\n\n"
 
 
 class StartEvent(BaseEvent):
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from functools import cached_property
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from src.llm.models import ModelProvider
@@ -74,20 +75,32 @@ class BaseHedgeFundRequest(BaseModel):
         """Extract agent IDs from graph structure"""
         return [node.id for node in self.graph_nodes]
 
+    @cached_property
+    def _agent_model_index(self) -> tuple[Dict[str, int], Dict[str, int]]:
+        """Position of the first agent model config for each unique node ID and base agent key"""
+        by_agent_id: Dict[str, int] = {}
+        by_base_key: Dict[str, int] = {}
+        for i, config in enumerate(self.agent_models or []):
+            by_agent_id.setdefault(config.agent_id, i)
+            by_base_key.setdefault(extract_base_agent_key(config.agent_id), i)
+        return by_agent_id, by_base_key
+
     def get_agent_model_config(self, agent_id: str) -> tuple[str, ModelProvider]:
         """Get model configuration for a specific agent"""
         if self.agent_models:
-            # Extract base agent key from unique node ID for matching
-            base_agent_key = extract_base_agent_key(agent_id)
-            
-            for config in self.agent_models:
-                # Check both unique node ID and base agent key for matches
-                config_base_key = extract_base_agent_key(config.agent_id)
-                if config.agent_id == agent_id or config_base_key == base_agent_key:
-                    return (
-                        config.model_name or self.model_name,
-                        config.model_provider or self.model_provider
-                    )
+            # Check both unique node ID and base agent key for matches, keeping the first
+            # matching config in list order
+            by_agent_id, by_base_key = self._agent_model_index
+            matches = [
+                i for i in (by_agent_id.get(agent_id), by_base_key.get(extract_base_agent_key(agent_id)))
+                if i is not None
+            ]
+            if matches:
+                config = self.agent_models[min(matches)]
+                return (
+                    config.model_name or self.model_name,
+                    config.model_provider or self.model_provider
+                )
         # Fallback to global model settings
         return self.model_name, self.model_provider
 
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from app.backend.database.models import HedgeFundFlow
 
@@ -31,6 +32,10 @@ class FlowRepository:
         """Get a flow by its ID"""
         return self.db.query(HedgeFundFlow).filter(HedgeFundFlow.id == flow_id).first()
     
+    def flow_exists(self, flow_id: int) -> bool:
+        """Check whether a flow exists without loading its nodes, edges and data"""
+        return self.db.query(exists().where(HedgeFundFlow.id == flow_id)).scalar()
+    
     def get_all_flows(self, include_templates: bool = True) -> List[HedgeFundFlow]:
         """Get all flows, optionally excluding templates"""
         query = self.db.query(HedgeFundFlow)
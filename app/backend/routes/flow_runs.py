@@ -10,7 +10,6 @@ from app.backend.models.schemas import (
     FlowRunUpdateRequest,
     FlowRunResponse,
     FlowRunSummaryResponse,
-    FlowRunStatus,
     ErrorResponse
 )
 
@@ -34,8 +33,7 @@ async def create_flow_run(
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Create the flow run
@@ -69,8 +67,7 @@ async def get_flow_runs(
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get flow runs
@@ -96,8 +93,7 @@ async def get_active_flow_run(flow_id: int, db: Session = Depends(get_db)):
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get active flow run
@@ -123,8 +119,7 @@ async def get_latest_flow_run(flow_id: int, db: Session = Depends(get_db)):
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get latest flow run
@@ -150,8 +145,7 @@ async def get_flow_run(flow_id: int, run_id: int, db: Session = Depends(get_db))
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get flow run
@@ -185,8 +179,7 @@ async def update_flow_run(
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Update flow run
@@ -226,8 +219,7 @@ async def delete_flow_run(flow_id: int, run_id: int, db: Session = Depends(get_d
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Verify run exists and belongs to this flow
@@ -260,8 +252,7 @@ async def delete_all_flow_runs(flow_id: int, db: Session = Depends(get_db)):
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Delete all flow runs
@@ -288,8 +279,7 @@ async def get_flow_run_count(flow_id: int, db: Session = Depends(get_db)):
     try:
         # Verify flow exists
         flow_repo = FlowRepository(db)
-        flow = flow_repo.get_flow_by_id(flow_id)
-        if not flow:
+        if not flow_repo.flow_exists(flow_id):
             raise HTTPException(status_code=404, detail="Flow not found")
         
         # Get run count
@@ -2,19 +2,43 @@ from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 import asyncio
+import json
+from datetime import date, datetime
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.backend.database import get_db
-from app.backend.models.schemas import ErrorResponse, HedgeFundRequest, BacktestRequest, BacktestDayResult, BacktestPerformanceMetrics
+from app.backend.models.schemas import ErrorResponse, HedgeFundRequest, BacktestRequest, BacktestPerformanceMetrics
 from app.backend.models.events import StartEvent, ProgressUpdateEvent, ErrorEvent, CompleteEvent
-from app.backend.services.graph import create_graph, parse_hedge_fund_response, run_graph_async
+from app.backend.services.graph import get_compiled_graph, parse_hedge_fund_response, run_graph_async
 from app.backend.services.portfolio import create_portfolio
-from app.backend.services.backtest_service import BacktestService
 from app.backend.services.api_key_service import ApiKeyService
 from src.utils.progress import progress
 from src.utils.analysts import get_agents_list
 
 router = APIRouter(prefix="/hedge-fund")
 
+
+def _json_default(value):
+    """Encode dates the way orjson does, so both serializers produce the same JSON."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_day_result(day_result: dict) -> str:
+    """Serialize a backtest day result, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(day_result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Types orjson can't handle fall back to the stdlib encoder
+            pass
+    return json.dumps(day_result, default=_json_default)
+
+
 @router.post(
     path="/run",
     responses={
@@ -34,11 +58,10 @@ async def run(request_data: HedgeFundRequest, request: Request, db: Session = De
         portfolio = create_portfolio(request_data.initial_cash, request_data.margin_requirement, request_data.tickers, request_data.portfolio_positions)
 
         # Construct agent graph using the React Flow graph structure
-        graph = create_graph(
+        graph = get_compiled_graph(
             graph_nodes=request_data.graph_nodes,
             graph_edges=request_data.graph_edges
         )
-        graph = graph.compile()
 
         # Log a test progress update for debugging
         progress.update_status("system", None, "Preparing hedge fund run")
@@ -190,8 +213,10 @@ async def backtest(request_data: BacktestRequest, request: Request, db: Session
         )
 
         # Construct agent graph using the React Flow graph structure (same as /run endpoint)
-        graph = create_graph(graph_nodes=request_data.graph_nodes, graph_edges=request_data.graph_edges)
-        graph = graph.compile()
+        graph = get_compiled_graph(graph_nodes=request_data.graph_nodes, graph_edges=request_data.graph_edges)
+
+        # Imported here so /run requests don't pay for loading the backtesting stack
+        from app.backend.services.backtest_service import BacktestService
 
         # Create backtest service with the compiled graph
         backtest_service = BacktestService(
@@ -240,17 +265,18 @@ async def backtest(request_data: BacktestRequest, request: Request, db: Session
                     )
                     progress_queue.put_nowait(event)
                 elif update["type"] == "backtest_result":
-                    # Convert day result to a streaming event
-                    backtest_result = BacktestDayResult(**update["data"])
-                    
+                    # Convert day result to a streaming event. The status line only needs
+                    # two fields, so read them from the dict rather than validating the
+                    # whole day result into a BacktestDayResult.
+                    day_result = update["data"]
+
                     # Send the full day result data as JSON in the analysis field
-                    import json
-                    analysis_data = json.dumps(update["data"])
-                    
+                    analysis_data = _dumps_day_result(day_result)
+
                     event = ProgressUpdateEvent(
                         agent="backtest",
                         ticker=None,
-                        status=f"Completed {backtest_result.date} - Portfolio: ${backtest_result.portfolio_value:,.2f}",
+                        status=f"Completed {day_result['date']} - Portfolio: ${day_result['portfolio_value']:,.2f}",
                         timestamp=None,
                         analysis=analysis_data
                     )
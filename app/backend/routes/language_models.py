@@ -1,15 +1,11 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends
 
 from app.backend.models.schemas import ErrorResponse
-from app.backend.services.ollama_service import OllamaService
+from app.backend.services.ollama_service import OllamaService, get_ollama_service
 from src.llm.models import get_models_list
 
 router = APIRouter(prefix="/language-models")
 
-# Initialize Ollama service
-ollama_service = OllamaService()
-
 @router.get(
     path="/",
     responses={
@@ -17,7 +13,7 @@ ollama_service = OllamaService()
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_language_models():
+async def get_language_models(ollama_service: OllamaService = Depends(get_ollama_service)):
     """Get the list of available cloud-based and Ollama language models."""
     try:
         # Start with cloud models
@@ -1,11 +1,11 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict
 import logging
 
 from app.backend.models.schemas import ErrorResponse
-from app.backend.services.ollama_service import ollama_service
+from app.backend.services.ollama_service import OllamaService, get_ollama_service
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ class ProgressResponse(BaseModel):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_ollama_status():
+async def get_ollama_status(ollama_service: OllamaService = Depends(get_ollama_service)):
     """Get Ollama installation and server status."""
     try:
         status = await ollama_service.check_ollama_status()
@@ -62,7 +62,7 @@ async def get_ollama_status():
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def start_ollama_server():
+async def start_ollama_server(ollama_service: OllamaService = Depends(get_ollama_service)):
     """Start the Ollama server."""
     try:
         # First check if it's already running
@@ -94,7 +94,7 @@ async def start_ollama_server():
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def stop_ollama_server():
+async def stop_ollama_server(ollama_service: OllamaService = Depends(get_ollama_service)):
     """Stop the Ollama server."""
     try:
         # First check if it's installed
@@ -126,14 +126,14 @@ async def stop_ollama_server():
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def download_model(request: ModelRequest):
+async def download_model(request: ModelRequest, ollama_service: OllamaService = Depends(get_ollama_service)):
     """Download an Ollama model (legacy endpoint)."""
     try:
         logger.info(f"Download request for model: {request.model_name}")
         
         # Check current status
         status = await ollama_service.check_ollama_status()
-        logger.debug(f"Current Ollama status: installed={status['installed']}, running={status['running']}")
+        logger.debug("Current Ollama status: installed=%s, running=%s", status["installed"], status["running"])
         
         if not status["installed"]:
             raise HTTPException(status_code=400, detail="Ollama is not installed on this system")
@@ -162,14 +162,14 @@ async def download_model(request: ModelRequest):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def download_model_with_progress(request: ModelRequest):
+async def download_model_with_progress(request: ModelRequest, ollama_service: OllamaService = Depends(get_ollama_service)):
     """Download an Ollama model with real-time progress updates via Server-Sent Events."""
     try:
         logger.info(f"Progress download request for model: {request.model_name}")
         
         # Check current status
         status = await ollama_service.check_ollama_status()
-        logger.debug(f"Current Ollama status: installed={status['installed']}, running={status['running']}")
+        logger.debug("Current Ollama status: installed=%s, running=%s", status["installed"], status["running"])
         
         if not status["installed"]:
             raise HTTPException(status_code=400, detail="Ollama is not installed on this system")
@@ -202,7 +202,7 @@ async def download_model_with_progress(request: ModelRequest):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_download_progress(model_name: str):
+async def get_download_progress(model_name: str, ollama_service: OllamaService = Depends(get_ollama_service)):
     """Get current download progress for a specific model."""
     try:
         progress = ollama_service.get_download_progress(model_name)
@@ -223,7 +223,7 @@ async def get_download_progress(model_name: str):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_active_downloads():
+async def get_active_downloads(ollama_service: OllamaService = Depends(get_ollama_service)):
     """Get all currently active model downloads."""
     try:
         active_downloads = {}
@@ -247,14 +247,14 @@ async def get_active_downloads():
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def delete_model(model_name: str):
+async def delete_model(model_name: str, ollama_service: OllamaService = Depends(get_ollama_service)):
     """Delete an Ollama model."""
     try:
         logger.info(f"Delete request for model: {model_name}")
         
         # Check current status
         status = await ollama_service.check_ollama_status()
-        logger.debug(f"Current Ollama status: installed={status['installed']}, running={status['running']}")
+        logger.debug("Current Ollama status: installed=%s, running=%s", status["installed"], status["running"])
         
         if not status["installed"]:
             raise HTTPException(status_code=400, detail="Ollama is not installed on this system")
@@ -283,7 +283,7 @@ async def delete_model(model_name: str):
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def get_recommended_models():
+async def get_recommended_models(ollama_service: OllamaService = Depends(get_ollama_service)):
     """Get list of recommended Ollama models."""
     try:
         models = await ollama_service.get_recommended_models()
@@ -300,7 +300,7 @@ async def get_recommended_models():
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def cancel_download(model_name: str):
+async def cancel_download(model_name: str, ollama_service: OllamaService = Depends(get_ollama_service)):
     """Cancel an active model download."""
     try:
         logger.info(f"Cancel download request for model: {model_name}")
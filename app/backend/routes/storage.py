@@ -1,5 +1,8 @@
 from fastapi import APIRouter, HTTPException
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 from pydantic import BaseModel
 
@@ -7,6 +10,22 @@ from app.backend.models.schemas import ErrorResponse
 
 router = APIRouter(prefix="/storage")
 
+# Saved outputs live in the project's /outputs directory
+OUTPUTS_DIR = Path(__file__).parent.parent.parent.parent / "outputs"
+
+
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode a plain open() would give a new file. The umask is process-wide, so it is read once at
+# import rather than briefly zeroed on every save while other threads may be creating files.
+_FILE_MODE = 0o666 & ~_read_umask()
+
+
 class SaveJsonRequest(BaseModel):
     filename: str
     data: dict
@@ -23,16 +42,36 @@ async def save_json_file(request: SaveJsonRequest):
     """Save JSON data to the project's /outputs directory."""
     try:
         # Create outputs directory if it doesn't exist
-        project_root = Path(__file__).parent.parent.parent.parent  # Navigate to project root
-        outputs_dir = project_root / "outputs"
+        outputs_dir = OUTPUTS_DIR
         outputs_dir.mkdir(exist_ok=True)
         
         # Construct file path
         file_path = outputs_dir / request.filename
         
-        # Save JSON data to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(request.data, f, indent=2, ensure_ascii=False)
+        # Save JSON data to a temporary file in the same directory, then atomically swap it
+        # into place so readers never see a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            try:
+                f = os.fdopen(fd, 'w', encoding='utf-8')
+            except BaseException:
+                os.close(fd)
+                raise
+            with f:
+                json.dump(request.data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the mode of the file being replaced, or
+            # give a new file the mode a direct write would have had
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = _FILE_MODE
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
         
         return {
             "success": True,
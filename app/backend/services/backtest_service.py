@@ -1,3 +1,5 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import pandas as pd
@@ -12,9 +14,14 @@ from src.tools.api import (
     get_financial_metrics,
     get_insider_trades,
 )
+from src.backtesting.types import HOLD_DECISION
 from app.backend.services.graph import run_graph_async, parse_hedge_fund_response
 from app.backend.services.portfolio import create_portfolio
 
+# Maximum number of concurrent data fetches while prefetching
+PREFETCH_MAX_WORKERS = 8
+
+
 class BacktestService:
     """
     Core backtesting service that focuses purely on backtesting logic.
@@ -222,16 +229,28 @@ class BacktestService:
     def prefetch_data(self):
         """Pre-fetch all data needed for the backtest period."""
         end_date_dt = datetime.strptime(self.end_date, "%Y-%m-%d")
-        start_date_dt = end_date_dt - relativedelta(years=1)
+        # Cover at least a year and the first day's one month lookback, so daily
+        # price lookups during the run are served from this single range fetch
+        start_date_dt = min(
+            end_date_dt - relativedelta(years=1),
+            datetime.strptime(self.start_date, "%Y-%m-%d") - relativedelta(months=1),
+        )
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
         api_key = self.request.api_keys.get("FINANCIAL_DATASETS_API_KEY")
         data_provider = getattr(self.request, "data_provider", "financial_datasets")
 
-        for ticker in self.tickers:
-            get_prices(ticker, start_date_str, self.end_date, api_key=api_key, data_provider=data_provider)
-            get_financial_metrics(ticker, self.end_date, limit=10, api_key=api_key, data_provider=data_provider)
-            get_insider_trades(ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key, data_provider=data_provider)
-            get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key, data_provider=data_provider)
+        # The fetches are independent and network bound, so overlap them
+        with ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS) as executor:
+            futures = []
+            for ticker in self.tickers:
+                futures.append(executor.submit(get_prices, ticker, start_date_str, self.end_date, api_key=api_key, data_provider=data_provider))
+                futures.append(executor.submit(get_financial_metrics, ticker, self.end_date, limit=10, api_key=api_key, data_provider=data_provider))
+                futures.append(executor.submit(get_insider_trades, ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key, data_provider=data_provider))
+                futures.append(executor.submit(get_company_news, ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key, data_provider=data_provider))
+
+            # Surface any fetch error, as the sequential prefetch did
+            for future in futures:
+                future.result()
 
     def _update_performance_metrics(self, performance_metrics: Dict[str, Any]):
         """Update performance metrics using daily returns."""
@@ -333,6 +352,7 @@ class BacktestService:
                 missing_data = False
 
                 data_provider = getattr(self.request, "data_provider", "financial_datasets")
+                api_key = (self.request.api_keys or {}).get("FINANCIAL_DATASETS_API_KEY")
                 for ticker in self.tickers:
                     try:
                         if data_provider == "yfinance":
@@ -380,7 +400,7 @@ class BacktestService:
 
             # Execute graph-based agent decisions
             try:
-                    result = await run_graph_async(
+                result = await run_graph_async(
                     graph=self.graph,
                     portfolio=portfolio_for_graph,
                     tickers=self.tickers,
@@ -388,7 +408,7 @@ class BacktestService:
                     end_date=current_date_str,
                     model_name=self.model_name,
                     model_provider=self.model_provider,
-                        data_provider=getattr(self.request, "data_provider", "yfinance"),
+                    data_provider=getattr(self.request, "data_provider", "yfinance"),
                     request=self.request,
                 )
                 
@@ -408,7 +428,7 @@ class BacktestService:
             # Execute trades based on decisions
             executed_trades = {}
             for ticker in self.tickers:
-                decision = decisions.get(ticker, {"action": "hold", "quantity": 0})
+                decision = decisions.get(ticker, HOLD_DECISION)
                 action, quantity = decision.get("action", "hold"), decision.get("quantity", 0)
                 executed_quantity = self.execute_trade(ticker, action, quantity, current_prices[ticker])
                 executed_trades[ticker] = executed_quantity
@@ -463,14 +483,15 @@ class BacktestService:
 
             # Build ticker details (similar to CLI format_backtest_row)
             for ticker in self.tickers:
-                ticker_signals = {}
-                for agent_name, signals in analyst_signals.items():
-                    if ticker in signals:
-                        ticker_signals[agent_name] = signals[ticker]
-
-                bullish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bullish"])
-                bearish_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "bearish"])
-                neutral_count = len([s for s in ticker_signals.values() if s.get("signal", "").lower() == "neutral"])
+                # Tally each agent's signal for this ticker in a single pass
+                signal_counts = Counter(
+                    signals[ticker].get("signal", "").lower()
+                    for signals in analyst_signals.values()
+                    if ticker in signals
+                )
+                bullish_count = signal_counts["bullish"]
+                bearish_count = signal_counts["bearish"]
+                neutral_count = signal_counts["neutral"]
 
                 # Calculate net position value
                 pos = self.portfolio["positions"][ticker]
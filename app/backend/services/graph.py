@@ -1,16 +1,19 @@
 import asyncio
-import json
 import re
+from functools import lru_cache, partial
+from typing import Sequence
 from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
 
 from app.backend.services.agent_service import create_agent_function
-from src.agents.portfolio_manager import portfolio_management_agent
-from src.agents.risk_manager import risk_management_agent
-from src.main import start
+from src.agents import get_agent
+from src.main import parse_hedge_fund_response, start
 from src.utils.analysts import ANALYST_CONFIG
 from src.graph.state import AgentState
 
+# Suffix appended to agent keys by the frontend to make node IDs unique
+_NODE_ID_SUFFIX_RE = re.compile(r'^[a-z0-9]+$')
+
 
 def extract_base_agent_key(unique_id: str) -> str:
     """
@@ -22,27 +25,45 @@ def extract_base_agent_key(unique_id: str) -> str:
     Returns:
         The base agent key (e.g., "warren_buffett")
     """
-    # For agent nodes, remove the last underscore and 6-character suffix
-    parts = unique_id.split('_')
-    if len(parts) >= 2:
-        last_part = parts[-1]
-        # If the last part is a 6-character alphanumeric string, it's likely our suffix
-        if len(last_part) == 6 and re.match(r'^[a-z0-9]+$', last_part):
-            return '_'.join(parts[:-1])
+    # For agent nodes, remove the last underscore and 6-character suffix. Slicing at the
+    # last underscore avoids splitting the whole ID into parts and joining them back.
+    base, sep, last_part = unique_id.rpartition('_')
+    # If the last part is a 6-character alphanumeric string, it's likely our suffix
+    if sep and len(last_part) == 6 and _NODE_ID_SUFFIX_RE.match(last_part):
+        return base
     return unique_id  # Return original if no suffix pattern found
 
 
 # Helper function to create the agent graph
 def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
     """Create the workflow based on the React Flow graph structure."""
+    return _build_graph(
+        [node.id for node in graph_nodes],
+        [(edge.source, edge.target) for edge in graph_edges],
+    )
+
+
+def get_compiled_graph(graph_nodes: list, graph_edges: list):
+    """Get the compiled workflow for a React Flow graph structure.
+
+    Compiled graphs hold no per-run state, so the same compiled graph is reused
+    for every request with an identical set of nodes and edges.
+    """
+    return _compile_graph(
+        tuple(node.id for node in graph_nodes),
+        tuple((edge.source, edge.target) for edge in graph_edges),
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_graph(agent_ids: tuple[str, ...], edges: tuple[tuple[str, str], ...]):
+    return _build_graph(agent_ids, edges).compile()
+
+
+def _build_graph(agent_ids: Sequence[str], edges: Sequence[tuple[str, str]]) -> StateGraph:
     graph = StateGraph(AgentState)
     graph.add_node("start_node", start)
 
-    # Get analyst nodes from the configuration
-    analyst_nodes = {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
-    
-    # Extract agent IDs from graph structure
-    agent_ids = [node.id for node in graph_nodes]
     agent_ids_set = set(agent_ids)
     
     # Track which nodes are portfolio managers for special handling
@@ -61,23 +82,23 @@ def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
         if base_agent_key not in ANALYST_CONFIG:
             continue
             
-        node_name, node_func = analyst_nodes[base_agent_key]
-        agent_function = create_agent_function(node_func, unique_agent_id)
+        # Only import the agents that are actually part of this flow
+        agent_function = create_agent_function(get_agent(base_agent_key), unique_agent_id)
         graph.add_node(unique_agent_id, agent_function)
     
     # Add portfolio manager nodes and their corresponding risk managers
     risk_manager_nodes = {}  # Map portfolio manager ID to risk manager ID
     for portfolio_manager_id in portfolio_manager_nodes:
-        portfolio_manager_function = create_agent_function(portfolio_management_agent, portfolio_manager_id)
+        portfolio_manager_function = create_agent_function(get_agent("portfolio_manager"), portfolio_manager_id)
         graph.add_node(portfolio_manager_id, portfolio_manager_function)
         
         # Create unique risk manager for this portfolio manager
-        suffix = portfolio_manager_id.split('_')[-1]
+        suffix = portfolio_manager_id.rpartition('_')[2]
         risk_manager_id = f"risk_management_agent_{suffix}"
         risk_manager_nodes[portfolio_manager_id] = risk_manager_id
         
         # Add the risk manager node
-        risk_manager_function = create_agent_function(risk_management_agent, risk_manager_id)
+        risk_manager_function = create_agent_function(get_agent("risk_manager"), risk_manager_id)
         graph.add_node(risk_manager_id, risk_manager_function)
 
     # Build connections based on React Flow graph structure
@@ -85,24 +106,24 @@ def create_graph(graph_nodes: list, graph_edges: list) -> StateGraph:
     nodes_with_outgoing_edges = set()
     direct_to_portfolio_managers = {}  # Map analyst ID to portfolio manager ID for direct connections
     
-    for edge in graph_edges:
+    for source, target in edges:
         # Only consider edges between agent nodes (not from stock tickers)
-        if edge.source in agent_ids_set and edge.target in agent_ids_set:
-            source_base_key = extract_base_agent_key(edge.source)
-            target_base_key = extract_base_agent_key(edge.target)
+        if source in agent_ids_set and target in agent_ids_set:
+            source_base_key = extract_base_agent_key(source)
+            target_base_key = extract_base_agent_key(target)
             
-            nodes_with_incoming_edges.add(edge.target)
-            nodes_with_outgoing_edges.add(edge.source)
+            nodes_with_incoming_edges.add(target)
+            nodes_with_outgoing_edges.add(source)
             
             # Check if this is a direct connection from analyst to portfolio manager
             if (source_base_key in ANALYST_CONFIG and 
                 source_base_key != "portfolio_manager" and 
                 target_base_key == "portfolio_manager"):
                 # Don't add direct edge to portfolio manager - we'll route through risk manager
-                direct_to_portfolio_managers[edge.source] = edge.target
+                direct_to_portfolio_managers[source] = target
             else:
                 # Add edge between agent nodes (but not direct to portfolio managers)
-                graph.add_edge(edge.source, edge.target)
+                graph.add_edge(source, target)
     
     # Connect start_node to nodes that don't have incoming edges from other agents
     for agent_id in agent_ids:
@@ -134,7 +155,9 @@ async def run_graph_async(graph, portfolio, tickers, start_date, end_date, model
     # Use run_in_executor to run the synchronous function in a separate thread
     # so it doesn't block the event loop
     loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(None, lambda: run_graph(graph, portfolio, tickers, start_date, end_date, model_name, model_provider, data_provider, request))  # Use default executor
+    # Bind the arguments now with partial rather than closing over them in a lambda
+    run = partial(run_graph, graph, portfolio, tickers, start_date, end_date, model_name, model_provider, data_provider, request)
+    result = await loop.run_in_executor(None, run)  # Use default executor
     return result
 
 
@@ -177,18 +200,3 @@ def run_graph(
             },
         },
     )
-
-
-def parse_hedge_fund_response(response):
-    """Parses a JSON string and returns a dictionary."""
-    try:
-        return json.loads(response)
-    except json.JSONDecodeError as e:
-        print(f"JSON decoding error: {e}\nResponse: {repr(response)}")
-        return None
-    except TypeError as e:
-        print(f"Invalid response type (expected string, got {type(response).__name__}): {e}")
-        return None
-    except Exception as e:
-        print(f"Unexpected error while parsing response: {e}\nResponse: {repr(response)}")
-        return None
@@ -1,17 +1,14 @@
 import asyncio
 import os
-import sys
 import platform
 import subprocess
 import time
-import re
 import json
-import queue
-import threading
 from pathlib import Path
 from typing import Dict, List, Optional, AsyncGenerator
 import logging
 import signal
+from functools import lru_cache
 import ollama
 
 logger = logging.getLogger(__name__)
@@ -34,8 +31,11 @@ class OllamaService:
     async def check_ollama_status(self) -> Dict[str, any]:
         """Check Ollama installation and server status."""
         try:
-            is_installed = await self._check_installation()
-            is_running = await self._check_server_running()
+            # The CLI lookup and the server probe are independent, so overlap them
+            is_installed, is_running = await asyncio.gather(
+                self._check_installation(),
+                self._check_server_running(),
+            )
             models, server_url = await self._get_server_info(is_running)
             
             status = {
@@ -47,7 +47,7 @@ class OllamaService:
                 "error": None
             }
             
-            logger.debug(f"Ollama status: installed={is_installed}, running={is_running}, models={len(models)}")
+            logger.debug("Ollama status: installed=%s, running=%s, models=%d", is_installed, is_running, len(models))
             return status
             
         except Exception as e:
@@ -90,7 +90,7 @@ class OllamaService:
             logger.error(f"Error downloading model {model_name}: {e}")
             return {"success": False, "message": f"Error downloading model: {str(e)}"}
     
-    async def download_model_with_progress(self, model_name: str) -> AsyncGenerator[str, None]:
+    async def download_model_with_progress(self, model_name: str) -> AsyncGenerator[bytes, None]:
         """Download an Ollama model with progress streaming."""
         async for progress_data in self._stream_model_download(model_name):
             yield progress_data
@@ -111,10 +111,9 @@ class OllamaService:
         """Get list of recommended Ollama models."""
         try:
             models_path = self._get_ollama_models_path()
-            
-            if models_path.exists():
+            try:
                 return self._load_models_from_file(models_path)
-            else:
+            except FileNotFoundError:
                 return self._get_fallback_models()
                 
         except Exception as e:
@@ -142,7 +141,7 @@ class OllamaService:
                 return []
             
             api_models = self._format_models_for_api(downloaded_models)
-            logger.debug(f"Returning {len(api_models)} Ollama models for language models API")
+            logger.debug("Returning %d Ollama models for language models API", len(api_models))
             return api_models
             
         except Exception as e:
@@ -211,7 +210,7 @@ class OllamaService:
             logger.debug("Ollama server confirmed running via client")
             return True
         except Exception as e:
-            logger.debug(f"Ollama server not reachable: {e}")
+            logger.debug("Ollama server not reachable: %s", e)
             return False
     
     async def _get_server_info(self, is_running: bool) -> tuple[List[str], str]:
@@ -223,10 +222,10 @@ class OllamaService:
             response = await self._async_client.list()
             models = [model.model for model in response.models]
             server_url = getattr(self._async_client, 'host', 'http://localhost:11434')
-            logger.debug(f"Found {len(models)} locally available models")
+            logger.debug("Found %d locally available models", len(models))
             return models, server_url
         except Exception as e:
-            logger.debug(f"Failed to get server info: {e}")
+            logger.debug("Failed to get server info: %s", e)
             return [], ""
     
     async def _execute_server_start(self) -> bool:
@@ -268,7 +267,7 @@ class OllamaService:
                 logger.info(f"Ollama server started successfully after {i+1} seconds")
                 return True
             except Exception:
-                logger.debug(f"Waiting for Ollama server... ({i+1}/20)")
+                logger.debug("Waiting for Ollama server... (%d/20)", i + 1)
                 continue
         
         logger.error("Ollama server failed to start within 20 seconds")
@@ -402,24 +401,24 @@ class OllamaService:
             logger.error(f"Error deleting model {model_name}: {e}")
             return False
     
-    async def _stream_model_download(self, model_name: str) -> AsyncGenerator[str, None]:
+    async def _stream_model_download(self, model_name: str) -> AsyncGenerator[bytes, None]:
         """Stream model download with progress updates."""
         try:
             if not await self._check_server_running():
-                yield f"data: {json.dumps({'status': 'error', 'error': 'Ollama server is not running'})}\n\n"
+                yield _sse_data({'status': 'error', 'error': 'Ollama server is not running'})
                 return
             
             logger.info(f"Starting download of model: {model_name}")
             self._download_progress[model_name] = {"status": "starting", "percentage": 0}
             
-            yield f"data: {json.dumps({'status': 'starting', 'percentage': 0, 'message': f'Starting download of {model_name}...'})}\n\n"
+            yield _sse_data({'status': 'starting', 'percentage': 0, 'message': f'Starting download of {model_name}...'})
             
             # Await the pull method to get the async iterator
             pull_stream = await self._async_client.pull(model_name, stream=True)
             async for progress in pull_stream:
                 progress_data = self._process_download_progress(progress, model_name)
                 if progress_data:
-                    yield f"data: {json.dumps(progress_data)}\n\n"
+                    yield _sse_data(progress_data)
                     
                     if progress_data.get("status") == "completed":
                         logger.info(f"Successfully downloaded model: {model_name}")
@@ -432,7 +431,7 @@ class OllamaService:
                 "error": str(e)
             }
             self._download_progress[model_name] = error_data
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield _sse_data(error_data)
             logger.error(f"Error downloading model {model_name}: {e}")
         finally:
             await asyncio.sleep(1)
@@ -487,9 +486,8 @@ class OllamaService:
         return Path(__file__).parent.parent.parent.parent / "src" / "llm" / "ollama_models.json"
     
     def _load_models_from_file(self, models_path: Path) -> List[Dict[str, str]]:
-        """Load models from JSON file."""
-        with open(models_path, 'r') as f:
-            return json.load(f)
+        """Load models from JSON file, re-reading it only when it has been modified."""
+        return list(_read_models_file(models_path, models_path.stat().st_mtime_ns))
     
     def _get_fallback_models(self) -> List[Dict[str, str]]:
         """Get fallback models when file is not available."""
@@ -515,5 +513,19 @@ class OllamaService:
         
         return api_models
 
-# Global service instance
-ollama_service = OllamaService() 
\ No newline at end of file
+def _sse_data(payload: dict) -> bytes:
+    """Format a payload as a Server-Sent Event data frame, encoded ready to stream."""
+    return b"data: " + json.dumps(payload).encode() + b"\n\n"
+
+
+@lru_cache(maxsize=4)
+def _read_models_file(models_path: Path, mtime_ns: int) -> List[Dict[str, str]]:
+    """Parse a models JSON file. The modification time is part of the cache key so edits are picked up."""
+    with open(models_path, 'r') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def get_ollama_service() -> OllamaService:
+    """Get the shared service instance, creating its Ollama clients on first use."""
+    return OllamaService()
\ No newline at end of file
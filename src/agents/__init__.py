@@ -0,0 +1,66 @@
+"""Investor and analyst agents.
+
+Each agent module pulls in pandas, LangChain and the LLM provider SDKs, so
+agents are imported on first access instead of when this package is imported.
+"""
+
+import importlib
+from collections.abc import Mapping
+from functools import lru_cache
+
+# Map of agent key -> (module, agent function name)
+_AGENT_MODULES = {
+    "aswath_damodaran": (".aswath_damodaran", "aswath_damodaran_agent"),
+    "ben_graham": (".ben_graham", "ben_graham_agent"),
+    "bill_ackman": (".bill_ackman", "bill_ackman_agent"),
+    "cathie_wood": (".cathie_wood", "cathie_wood_agent"),
+    "charlie_munger": (".charlie_munger", "charlie_munger_agent"),
+    "michael_burry": (".michael_burry", "michael_burry_agent"),
+    "mohnish_pabrai": (".mohnish_pabrai", "mohnish_pabrai_agent"),
+    "peter_lynch": (".peter_lynch", "peter_lynch_agent"),
+    "phil_fisher": (".phil_fisher", "phil_fisher_agent"),
+    "rakesh_jhunjhunwala": (".rakesh_jhunjhunwala", "rakesh_jhunjhunwala_agent"),
+    "stanley_druckenmiller": (".stanley_druckenmiller", "stanley_druckenmiller_agent"),
+    "warren_buffett": (".warren_buffett", "warren_buffett_agent"),
+    "technical_analyst": (".technicals", "technical_analyst_agent"),
+    "fundamentals_analyst": (".fundamentals", "fundamentals_analyst_agent"),
+    "sentiment_analyst": (".sentiment", "sentiment_analyst_agent"),
+    "valuation_analyst": (".valuation", "valuation_analyst_agent"),
+    "portfolio_manager": (".portfolio_manager", "portfolio_management_agent"),
+    "risk_manager": (".risk_manager", "risk_management_agent"),
+}
+
+# Map of agent function name -> agent key, for `from src.agents import <agent function>`
+_AGENT_FUNCTIONS = {attr: key for key, (_, attr) in _AGENT_MODULES.items()}
+
+
+@lru_cache(maxsize=None)
+def get_agent(name: str):
+    """Import and return the agent function registered under the given key."""
+    try:
+        module_name, attr = _AGENT_MODULES[name]
+    except KeyError:
+        raise KeyError(f"Unknown agent: {name}") from None
+    return getattr(importlib.import_module(module_name, __name__), attr)
+
+
+class _LazyAgents(Mapping):
+    """Read-only mapping of agent key -> agent function that imports agents on access."""
+
+    def __getitem__(self, name: str):
+        return get_agent(name)
+
+    def __iter__(self):
+        return iter(_AGENT_MODULES)
+
+    def __len__(self) -> int:
+        return len(_AGENT_MODULES)
+
+
+AVAILABLE_AGENTS = _LazyAgents()
+
+
+def __getattr__(name: str):
+    if name in _AGENT_FUNCTIONS:
+        return get_agent(_AGENT_FUNCTIONS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
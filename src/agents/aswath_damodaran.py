@@ -362,23 +362,11 @@ def estimate_cost_of_equity(beta: float | None) -> float:
 # ────────────────────────────────────────────────────────────────────────────────
 # LLM generation
 # ────────────────────────────────────────────────────────────────────────────────
-def generate_damodaran_output(
-    ticker: str,
-    analysis_data: dict[str, any],
-    state: AgentState,
-    agent_id: str,
-) -> AswathDamodaranSignal:
-    """
-    Ask the LLM to channel Prof. Damodaran's analytical style:
-      • Story → Numbers → Value narrative
-      • Emphasize risk, growth, and cash-flow assumptions
-      • Cite cost of capital, implied MOS, and valuation cross-checks
-    """
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are Aswath Damodaran, Professor of Finance at NYU Stern.
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are Aswath Damodaran, Professor of Finance at NYU Stern.
                 Use your valuation framework to issue trading signals on US equities.
 
                 Speak with your usual clear, data-driven tone:
@@ -387,10 +375,10 @@ def generate_damodaran_output(
                   ◦ Conclude with value: your FCFF DCF estimate, margin of safety, and relative valuation sanity checks
                   ◦ Highlight major uncertainties and how they affect value
                 Return ONLY the JSON specified below.""",
-            ),
-            (
-                "human",
-                """Ticker: {ticker}
+        ),
+        (
+            "human",
+            """Ticker: {ticker}
 
                 Analysis data:
                 {analysis_data}
@@ -401,11 +389,24 @@ def generate_damodaran_output(
                   "confidence": float (0-100),
                   "reasoning": "string"
                 }}""",
-            ),
-        ]
-    )
+        ),
+    ]
+)
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+
+def generate_damodaran_output(
+    ticker: str,
+    analysis_data: dict[str, any],
+    state: AgentState,
+    agent_id: str,
+) -> AswathDamodaranSignal:
+    """
+    Ask the LLM to channel Prof. Damodaran's analytical style:
+      • Story → Numbers → Value narrative
+      • Emphasize risk, growth, and cash-flow assumptions
+      • Cite cost of capital, implied MOS, and valuation cross-checks
+    """
+    prompt = _PROMPT_TEMPLATE.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
 
     def default_signal():
         return AswathDamodaranSignal(
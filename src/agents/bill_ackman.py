@@ -138,6 +138,11 @@ def bill_ackman_agent(state: AgentState, agent_id: str = "bill_ackman_agent"):
     }
 
 
+def _non_null_values(financial_line_items: list, field: str) -> list:
+    """Return the non-null values of `field` across the line items, reading each attribute once."""
+    return [value for value in (getattr(item, field, None) for item in financial_line_items) if value is not None]
+
+
 def analyze_business_quality(metrics: list, financial_line_items: list) -> dict:
     """
     Analyze whether the company has a high-quality business with stable or growing cash flows,
@@ -154,7 +159,7 @@ def analyze_business_quality(metrics: list, financial_line_items: list) -> dict:
         }
     
     # 1. Multi-period revenue growth analysis
-    revenues = [getattr(item, 'revenue', None) for item in financial_line_items if getattr(item, 'revenue', None) is not None]
+    revenues = _non_null_values(financial_line_items, 'revenue')
     if len(revenues) >= 2:
         initial, final = revenues[-1], revenues[0]
         if initial and final and final > initial:
@@ -171,8 +176,8 @@ def analyze_business_quality(metrics: list, financial_line_items: list) -> dict:
         details.append("Not enough revenue data for multi-period trend.")
     
     # 2. Operating margin and free cash flow consistency
-    fcf_vals = [getattr(item, 'free_cash_flow', None) for item in financial_line_items if getattr(item, 'free_cash_flow', None) is not None]
-    op_margin_vals = [getattr(item, 'operating_margin', None) for item in financial_line_items if getattr(item, 'operating_margin', None) is not None]
+    fcf_vals = _non_null_values(financial_line_items, 'free_cash_flow')
+    op_margin_vals = _non_null_values(financial_line_items, 'operating_margin')
     
     if op_margin_vals:
         above_15 = sum(1 for m in op_margin_vals if m > 0.15)
@@ -232,7 +237,7 @@ def analyze_financial_discipline(metrics: list, financial_line_items: list) -> d
         }
     
     # 1. Multi-period debt ratio or debt_to_equity
-    debt_to_equity_vals = [getattr(item, 'debt_to_equity', None) for item in financial_line_items if getattr(item, 'debt_to_equity', None) is not None]
+    debt_to_equity_vals = _non_null_values(financial_line_items, 'debt_to_equity')
     if debt_to_equity_vals:
         below_one_count = sum(1 for d in debt_to_equity_vals if d < 1.0)
         if below_one_count >= (len(debt_to_equity_vals) // 2 + 1):
@@ -274,7 +279,7 @@ def analyze_financial_discipline(metrics: list, financial_line_items: list) -> d
         details.append("No dividend data found across periods.")
     
     # Check for decreasing share count (simple approach)
-    shares = [getattr(item, 'outstanding_shares', None) for item in financial_line_items if getattr(item, 'outstanding_shares', None) is not None]
+    shares = _non_null_values(financial_line_items, 'outstanding_shares')
     if len(shares) >= 2:
         # For buybacks, the newest count should be less than the oldest count
         if shares[0] < shares[-1]:
@@ -307,8 +312,8 @@ def analyze_activism_potential(financial_line_items: list) -> dict:
         }
     
     # Check revenue growth vs. operating margin
-    revenues = [getattr(item, 'revenue', None) for item in financial_line_items if getattr(item, 'revenue', None) is not None]
-    op_margins = [getattr(item, 'operating_margin', None) for item in financial_line_items if getattr(item, 'operating_margin', None) is not None]
+    revenues = _non_null_values(financial_line_items, 'revenue')
+    op_margins = _non_null_values(financial_line_items, 'operating_margin')
     
     if len(revenues) < 2 or not op_margins:
         return {
@@ -400,21 +405,10 @@ def analyze_valuation(financial_line_items: list, market_cap: float) -> dict:
     }
 
 
-def generate_ackman_output(
-    ticker: str,
-    analysis_data: dict[str, any],
-    state: AgentState,
-    agent_id: str,
-) -> BillAckmanSignal:
-    """
-    Generates investment decisions in the style of Bill Ackman.
-    Includes more explicit references to brand strength, activism potential, 
-    catalysts, and management changes in the system prompt.
-    """
-    template = ChatPromptTemplate.from_messages([
-        (
-            "system",
-            """You are a Bill Ackman AI agent, making investment decisions using his principles:
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        """You are a Bill Ackman AI agent, making investment decisions using his principles:
 
             1. Seek high-quality businesses with durable competitive advantages (moats), often in well-known consumer or service brands.
             2. Prioritize consistent free cash flow and growth potential over the long term.
@@ -433,10 +427,10 @@ def generate_ackman_output(
 
             Return your final recommendation (signal: bullish, neutral, or bearish) with a 0-100 confidence and a thorough reasoning section.
             """
-        ),
-        (
-            "human",
-            """Based on the following analysis, create an Ackman-style investment signal.
+    ),
+    (
+        "human",
+        """Based on the following analysis, create an Ackman-style investment signal.
 
             Analysis Data for {ticker}:
             {analysis_data}
@@ -448,10 +442,22 @@ def generate_ackman_output(
               "reasoning": "string"
             }}
             """
-        )
-    ])
+    )
+])
+
 
-    prompt = template.invoke({
+def generate_ackman_output(
+    ticker: str,
+    analysis_data: dict[str, any],
+    state: AgentState,
+    agent_id: str,
+) -> BillAckmanSignal:
+    """
+    Generates investment decisions in the style of Bill Ackman.
+    Includes more explicit references to brand strength, activism potential, 
+    catalysts, and management changes in the system prompt.
+    """
+    prompt = _PROMPT_TEMPLATE.invoke({
         "analysis_data": json.dumps(analysis_data, indent=2),
         "ticker": ticker
     })
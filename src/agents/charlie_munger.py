@@ -5,6 +5,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
+from collections import Counter
 from typing_extensions import Literal
 from src.utils.progress import progress
 from src.utils.llm import call_llm
@@ -376,11 +377,13 @@ def analyze_management_quality(financial_line_items: list, insider_trades: list)
     
     # 4. Insider activity - Munger values skin in the game
     if insider_trades and len(insider_trades) > 0:
-        # Count buys vs. sells
-        buys = sum(1 for trade in insider_trades if hasattr(trade, 'transaction_type') and 
-                   trade.transaction_type and trade.transaction_type.lower() in ['buy', 'purchase'])
-        sells = sum(1 for trade in insider_trades if hasattr(trade, 'transaction_type') and 
-                    trade.transaction_type and trade.transaction_type.lower() in ['sell', 'sale'])
+        # Count buys vs. sells, lowercasing each trade's transaction type once
+        transaction_types = Counter(
+            trade.transaction_type.lower() for trade in insider_trades
+            if getattr(trade, 'transaction_type', None)
+        )
+        buys = transaction_types['buy'] + transaction_types['purchase']
+        sells = transaction_types['sell'] + transaction_types['sale']
         
         # Calculate the buy ratio
         total_trades = buys + sells
@@ -436,14 +439,8 @@ def analyze_management_quality(financial_line_items: list, insider_trades: list)
     if cash_values and revenue_values and revenue_values[0] and revenue_values[0] > 0:
         cash_to_revenue = cash_values[0] / revenue_values[0]
 
-    # Insider ratio -> we compute `insider_buy_ratio`
+    # Insider ratio -> we compute `insider_buy_ratio` from the buys/sells counted for scoring
     if insider_trades and len(insider_trades) > 0:
-        buys = sum(1 for t in insider_trades
-                   if getattr(t, "transaction_type", None)
-                   and t.transaction_type.lower() in ["buy", "purchase"])
-        sells = sum(1 for t in insider_trades
-                    if getattr(t, "transaction_type", None)
-                    and t.transaction_type.lower() in ["sell", "sale"])
         total = buys + sells
         insider_buy_ratio = (buys / total) if total > 0 else None
 
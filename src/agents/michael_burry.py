@@ -317,19 +317,11 @@ def _analyze_contrarian_sentiment(news):
 # LLM generation
 ###############################################################################
 
-def _generate_burry_output(
-    ticker: str,
-    analysis_data: dict,
-    state: AgentState,
-    agent_id: str,
-) -> MichaelBurrySignal:
-    """Call the LLM to craft the final trading signal in Burry's voice."""
-
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are an AI agent emulating Dr. Michael J. Burry. Your mandate:
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are an AI agent emulating Dr. Michael J. Burry. Your mandate:
                 - Hunt for deep value in US equities using hard numbers (free cash flow, EV/EBIT, balance sheet)
                 - Be contrarian: hatred in the press can be your friend if fundamentals are solid
                 - Focus on downside first – avoid leveraged balance sheets
@@ -346,10 +338,10 @@ def _generate_burry_output(
                 For example, if bullish: "FCF yield 12.8%. EV/EBIT 6.2. Debt-to-equity 0.4. Net insider buying 25k shares. Market missing value due to overreaction to recent litigation. Strong buy."
                 For example, if bearish: "FCF yield only 2.1%. Debt-to-equity concerning at 2.3. Management diluting shareholders. Pass."
                 """,
-            ),
-            (
-                "human",
-                """Based on the following data, create the investment signal as Michael Burry would:
+        ),
+        (
+            "human",
+            """Based on the following data, create the investment signal as Michael Burry would:
 
                 Analysis Data for {ticker}:
                 {analysis_data}
@@ -361,11 +353,20 @@ def _generate_burry_output(
                   "reasoning": "string"
                 }}
                 """,
-            ),
-        ]
-    )
+        ),
+    ]
+)
+
+
+def _generate_burry_output(
+    ticker: str,
+    analysis_data: dict,
+    state: AgentState,
+    agent_id: str,
+) -> MichaelBurrySignal:
+    """Call the LLM to craft the final trading signal in Burry's voice."""
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+    prompt = _PROMPT_TEMPLATE.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
 
     # Default fallback signal in case parsing fails
     def create_default_michael_burry_signal():
@@ -303,17 +303,10 @@ def analyze_double_potential(financial_line_items: list, market_cap: float | Non
     return {"score": min(10, score), "details": "; ".join(details)}
 
 
-def generate_pabrai_output(
-    ticker: str,
-    analysis_data: dict[str, any],
-    state: AgentState,
-    agent_id: str,
-) -> MohnishPabraiSignal:
-    """Generate Pabrai-style decision focusing on low risk, high uncertainty bets and cloning."""
-    template = ChatPromptTemplate.from_messages([
-        (
-          "system",
-          """You are Mohnish Pabrai. Apply my value investing philosophy:
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
+    (
+      "system",
+      """You are Mohnish Pabrai. Apply my value investing philosophy:
 
           - Heads I win; tails I don't lose much: prioritize downside protection first.
           - Buy businesses with simple, understandable models and durable moats.
@@ -325,10 +318,10 @@ def generate_pabrai_output(
 
             Provide candid, checklist-driven reasoning, with emphasis on capital preservation and expected mispricing.
             """,
-        ),
-        (
-          "human",
-          """Analyze {ticker} using the provided data.
+    ),
+    (
+      "human",
+      """Analyze {ticker} using the provided data.
 
           DATA:
           {analysis_data}
@@ -340,10 +333,18 @@ def generate_pabrai_output(
             "reasoning": "string with Pabrai-style analysis focusing on downside protection, FCF yield, and doubling potential"
           }}
           """,
-        ),
-    ])
+    ),
+])
+
 
-    prompt = template.invoke({
+def generate_pabrai_output(
+    ticker: str,
+    analysis_data: dict[str, any],
+    state: AgentState,
+    agent_id: str,
+) -> MohnishPabraiSignal:
+    """Generate Pabrai-style decision focusing on low risk, high uncertainty bets and cloning."""
+    prompt = _PROMPT_TEMPLATE.invoke({
         "analysis_data": json.dumps(analysis_data, indent=2),
         "ticker": ticker,
     })
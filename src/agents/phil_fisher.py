@@ -12,6 +12,7 @@ from pydantic import BaseModel
 import json
 from typing_extensions import Literal
 from src.utils.progress import progress
+from src.utils.news import is_negative_headline
 from src.utils.llm import call_llm
 import statistics
 from src.utils.api_key import get_api_key_from_state
@@ -511,11 +512,9 @@ def analyze_sentiment(news_items: list) -> dict:
     if not news_items:
         return {"score": 5, "details": "No news data; defaulting to neutral sentiment"}
 
-    negative_keywords = ["lawsuit", "fraud", "negative", "downturn", "decline", "investigation", "recall"]
     negative_count = 0
     for news in news_items:
-        title_lower = (news.title or "").lower()
-        if any(word in title_lower for word in negative_keywords):
+        if is_negative_headline(news.title):
             negative_count += 1
 
     details = []
@@ -532,20 +531,11 @@ def analyze_sentiment(news_items: list) -> dict:
     return {"score": score, "details": "; ".join(details)}
 
 
-def generate_fisher_output(
-    ticker: str,
-    analysis_data: dict[str, any],
-    state: AgentState,
-    agent_id: str,
-) -> PhilFisherSignal:
-    """
-    Generates a JSON signal in the style of Phil Fisher.
-    """
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-              "system",
-              """You are a Phil Fisher AI agent, making investment decisions using his principles:
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+          "system",
+          """You are a Phil Fisher AI agent, making investment decisions using his principles:
   
               1. Emphasize long-term growth potential and quality of management.
               2. Focus on companies investing in R&D for future products/services.
@@ -570,10 +560,10 @@ def generate_fisher_output(
                 - "confidence": a float between 0 and 100
                 - "reasoning": a detailed explanation
               """,
-            ),
-            (
-              "human",
-              """Based on the following analysis, create a Phil Fisher-style investment signal.
+        ),
+        (
+          "human",
+          """Based on the following analysis, create a Phil Fisher-style investment signal.
 
               Analysis Data for {ticker}:
               {analysis_data}
@@ -585,11 +575,21 @@ def generate_fisher_output(
                 "reasoning": "string"
               }}
               """,
-            ),
-        ]
-    )
+        ),
+    ]
+)
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+
+def generate_fisher_output(
+    ticker: str,
+    analysis_data: dict[str, any],
+    state: AgentState,
+    agent_id: str,
+) -> PhilFisherSignal:
+    """
+    Generates a JSON signal in the style of Phil Fisher.
+    """
+    prompt = _PROMPT_TEMPLATE.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
 
     def create_default_signal():
         return PhilFisherSignal(
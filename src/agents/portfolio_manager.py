@@ -1,5 +1,4 @@
 import json
-import time
 from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 
@@ -174,6 +173,30 @@ def _compact_signals(signals_by_ticker: dict[str, dict]) -> dict[str, dict]:
     return out
 
 
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are a portfolio manager.\n"
+            "Inputs per ticker: analyst signals and allowed actions with max qty (already validated).\n"
+            "Pick one allowed action per ticker and a quantity ≤ the max. "
+            "Keep reasoning very concise (max 100 chars). No cash or margin math. Return JSON only."
+        ),
+        (
+            "human",
+            "Signals:\n{signals}\n\n"
+            "Allowed:\n{allowed}\n\n"
+            "Format:\n"
+            "{{\n"
+            '  "decisions": {{\n'
+            '    "TICKER": {{"action":"...","quantity":int,"confidence":int,"reasoning":"..."}}\n'
+            "  }}\n"
+            "}}"
+        ),
+    ]
+)
+
+
 def generate_trading_decision(
         tickers: list[str],
         signals_by_ticker: dict[str, dict],
@@ -208,35 +231,11 @@ def generate_trading_decision(
     compact_signals = _compact_signals({t: signals_by_ticker.get(t, {}) for t in tickers_for_llm})
     compact_allowed = {t: allowed_actions_full[t] for t in tickers_for_llm}
 
-    # Minimal prompt template
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are a portfolio manager.\n"
-                "Inputs per ticker: analyst signals and allowed actions with max qty (already validated).\n"
-                "Pick one allowed action per ticker and a quantity ≤ the max. "
-                "Keep reasoning very concise (max 100 chars). No cash or margin math. Return JSON only."
-            ),
-            (
-                "human",
-                "Signals:\n{signals}\n\n"
-                "Allowed:\n{allowed}\n\n"
-                "Format:\n"
-                "{{\n"
-                '  "decisions": {{\n'
-                '    "TICKER": {{"action":"...","quantity":int,"confidence":int,"reasoning":"..."}}\n'
-                "  }}\n"
-                "}}"
-            ),
-        ]
-    )
-
     prompt_data = {
         "signals": json.dumps(compact_signals, separators=(",", ":"), ensure_ascii=False),
         "allowed": json.dumps(compact_allowed, separators=(",", ":"), ensure_ascii=False),
     }
-    prompt = template.invoke(prompt_data)
+    prompt = _PROMPT_TEMPLATE.invoke(prompt_data)
 
     # Default factory fills remaining tickers as hold if the LLM fails
     def create_default_portfolio_output():
@@ -645,18 +645,11 @@ def analyze_rakesh_jhunjhunwala_style(
 # ────────────────────────────────────────────────────────────────────────────────
 # LLM generation
 # ────────────────────────────────────────────────────────────────────────────────
-def generate_jhunjhunwala_output(
-    ticker: str,
-    analysis_data: dict[str, any],
-    state: AgentState,
-    agent_id: str,
-) -> RakeshJhunjhunwalaSignal:
-    """Get investment decision from LLM with Jhunjhunwala's principles"""
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are a Rakesh Jhunjhunwala AI agent. Decide on investment signals based on Rakesh Jhunjhunwala's principles:
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are a Rakesh Jhunjhunwala AI agent. Decide on investment signals based on Rakesh Jhunjhunwala's principles:
                 - Circle of Competence: Only invest in businesses you understand
                 - Margin of Safety (> 30%): Buy at a significant discount to intrinsic value
                 - Economic Moat: Look for durable competitive advantages
@@ -678,10 +671,10 @@ def generate_jhunjhunwala_output(
 
                 Follow these guidelines strictly.
                 """,
-            ),
-            (
-                "human",
-                """Based on the following data, create the investment signal as Rakesh Jhunjhunwala would:
+        ),
+        (
+            "human",
+            """Based on the following data, create the investment signal as Rakesh Jhunjhunwala would:
 
                 Analysis Data for {ticker}:
                 {analysis_data}
@@ -693,11 +686,19 @@ def generate_jhunjhunwala_output(
                   "reasoning": "string"
                 }}
                 """,
-            ),
-        ]
-    )
+        ),
+    ]
+)
 
-    prompt = template.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
+
+def generate_jhunjhunwala_output(
+    ticker: str,
+    analysis_data: dict[str, any],
+    state: AgentState,
+    agent_id: str,
+) -> RakeshJhunjhunwalaSignal:
+    """Get investment decision from LLM with Jhunjhunwala's principles"""
+    prompt = _PROMPT_TEMPLATE.invoke({"analysis_data": json.dumps(analysis_data, indent=2), "ticker": ticker})
 
     # Default fallback signal in case parsing fails
     def create_default_rakesh_jhunjhunwala_signal():
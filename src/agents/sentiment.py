@@ -2,7 +2,6 @@ from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
 import pandas as pd
-import numpy as np
 import json
 from src.utils.api_key import get_api_key_from_state
 from src.tools.api import get_insider_trades, get_company_news
@@ -37,7 +36,11 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
 
         # Get the signals from the insider trades
         transaction_shares = pd.Series([t.transaction_shares for t in insider_trades]).dropna()
-        insider_signals = np.where(transaction_shares < 0, "bearish", "bullish").tolist()
+        # Count signals with vectorised comparisons instead of labelling every trade and
+        # re-counting the labels each time a total is needed
+        insider_total = len(transaction_shares)
+        insider_bearish = int((transaction_shares < 0).sum())
+        insider_bullish = insider_total - insider_bearish
 
         progress.update_status(agent_id, ticker, "Fetching company news")
 
@@ -46,8 +49,10 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
 
         # Get the sentiment from the company news
         sentiment = pd.Series([n.sentiment for n in company_news]).dropna()
-        news_signals = np.where(sentiment == "negative", "bearish", 
-                              np.where(sentiment == "positive", "bullish", "neutral")).tolist()
+        news_total = len(sentiment)
+        news_bearish = int((sentiment == "negative").sum())
+        news_bullish = int((sentiment == "positive").sum())
+        news_neutral = news_total - news_bearish - news_bullish
         
         progress.update_status(agent_id, ticker, "Combining signals")
         # Combine signals from both sources with weights
@@ -56,12 +61,12 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
         
         # Calculate weighted signal counts
         bullish_signals = (
-            insider_signals.count("bullish") * insider_weight +
-            news_signals.count("bullish") * news_weight
+            insider_bullish * insider_weight +
+            news_bullish * news_weight
         )
         bearish_signals = (
-            insider_signals.count("bearish") * insider_weight +
-            news_signals.count("bearish") * news_weight
+            insider_bearish * insider_weight +
+            news_bearish * news_weight
         )
 
         if bullish_signals > bearish_signals:
@@ -72,7 +77,7 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
             overall_signal = "neutral"
 
         # Calculate confidence level based on the weighted proportion
-        total_weighted_signals = len(insider_signals) * insider_weight + len(news_signals) * news_weight
+        total_weighted_signals = insider_total * insider_weight + news_total * news_weight
         confidence = 0  # Default confidence when there are no signals
         if total_weighted_signals > 0:
             confidence = round((max(bullish_signals, bearish_signals) / total_weighted_signals) * 100, 2)
@@ -80,30 +85,30 @@ def sentiment_analyst_agent(state: AgentState, agent_id: str = "sentiment_analys
         # Create structured reasoning similar to technical analysis
         reasoning = {
             "insider_trading": {
-                "signal": "bullish" if insider_signals.count("bullish") > insider_signals.count("bearish") else 
-                         "bearish" if insider_signals.count("bearish") > insider_signals.count("bullish") else "neutral",
-                "confidence": round((max(insider_signals.count("bullish"), insider_signals.count("bearish")) / max(len(insider_signals), 1)) * 100),
+                "signal": "bullish" if insider_bullish > insider_bearish else 
+                         "bearish" if insider_bearish > insider_bullish else "neutral",
+                "confidence": round((max(insider_bullish, insider_bearish) / max(insider_total, 1)) * 100),
                 "metrics": {
-                    "total_trades": len(insider_signals),
-                    "bullish_trades": insider_signals.count("bullish"),
-                    "bearish_trades": insider_signals.count("bearish"),
+                    "total_trades": insider_total,
+                    "bullish_trades": insider_bullish,
+                    "bearish_trades": insider_bearish,
                     "weight": insider_weight,
-                    "weighted_bullish": round(insider_signals.count("bullish") * insider_weight, 1),
-                    "weighted_bearish": round(insider_signals.count("bearish") * insider_weight, 1),
+                    "weighted_bullish": round(insider_bullish * insider_weight, 1),
+                    "weighted_bearish": round(insider_bearish * insider_weight, 1),
                 }
             },
             "news_sentiment": {
-                "signal": "bullish" if news_signals.count("bullish") > news_signals.count("bearish") else 
-                         "bearish" if news_signals.count("bearish") > news_signals.count("bullish") else "neutral",
-                "confidence": round((max(news_signals.count("bullish"), news_signals.count("bearish")) / max(len(news_signals), 1)) * 100),
+                "signal": "bullish" if news_bullish > news_bearish else 
+                         "bearish" if news_bearish > news_bullish else "neutral",
+                "confidence": round((max(news_bullish, news_bearish) / max(news_total, 1)) * 100),
                 "metrics": {
-                    "total_articles": len(news_signals),
-                    "bullish_articles": news_signals.count("bullish"),
-                    "bearish_articles": news_signals.count("bearish"),
-                    "neutral_articles": news_signals.count("neutral"),
+                    "total_articles": news_total,
+                    "bullish_articles": news_bullish,
+                    "bearish_articles": news_bearish,
+                    "neutral_articles": news_neutral,
                     "weight": news_weight,
-                    "weighted_bullish": round(news_signals.count("bullish") * news_weight, 1),
-                    "weighted_bearish": round(news_signals.count("bearish") * news_weight, 1),
+                    "weighted_bullish": round(news_bullish * news_weight, 1),
+                    "weighted_bearish": round(news_bearish * news_weight, 1),
                 }
             },
             "combined_analysis": {
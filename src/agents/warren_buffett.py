@@ -11,10 +11,13 @@ from src.utils.progress import progress
 from src.utils.api_key import get_api_key_from_state
 from src.utils.financial_data import (
     safe_get_numeric_field, 
-    calculate_working_capital_change,
     validate_required_fields
 )
 
+# Line items needed to compute owner earnings
+OWNER_EARNINGS_FIELDS = ("net_income", "depreciation_and_amortization", "capital_expenditure")
+
+
 class WarrenBuffettSignal(BaseModel):
     signal: Literal["bullish", "bearish", "neutral"]
     confidence: int = Field(description="Confidence 0-100")
@@ -398,8 +401,7 @@ def calculate_owner_earnings(financial_line_items: list) -> dict[str, any]:
     details = []
 
     # Core components - use safe field access
-    required_fields = ["net_income", "depreciation_and_amortization", "capital_expenditure"]
-    is_valid, missing_fields = validate_required_fields(latest, required_fields)
+    is_valid, missing_fields = validate_required_fields(latest, OWNER_EARNINGS_FIELDS)
     
     if not is_valid:
         return {"owner_earnings": None, "details": [f"Missing components: {', '.join(missing_fields)}"]}
@@ -422,7 +424,7 @@ def calculate_owner_earnings(financial_line_items: list) -> dict[str, any]:
             current_assets_previous = getattr(previous, 'current_assets', None)
             current_liab_previous = getattr(previous, 'current_liabilities', None)
 
-            if all([current_assets_current, current_liab_current, current_assets_previous, current_liab_previous]):
+            if current_assets_current and current_liab_current and current_assets_previous and current_liab_previous:
                 wc_current = current_assets_current - current_liab_current
                 wc_previous = current_assets_previous - current_liab_previous
                 working_capital_change = wc_current - wc_previous
@@ -750,6 +752,49 @@ def analyze_pricing_power(financial_line_items: list, metrics: list) -> dict[str
     }
 
 
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are Warren Buffett. Decide bullish, bearish, or neutral using only the provided facts.\n"
+            "\n"
+            "Checklist for decision:\n"
+            "- Circle of competence\n"
+            "- Competitive moat\n"
+            "- Management quality\n"
+            "- Financial strength\n"
+            "- Valuation vs intrinsic value\n"
+            "- Long-term prospects\n"
+            "\n"
+            "Signal rules:\n"
+            "- Bullish: strong business AND margin_of_safety > 0.\n"
+            "- Bearish: poor business OR clearly overvalued.\n"
+            "- Neutral: good business but margin_of_safety <= 0, or mixed evidence.\n"
+            "\n"
+            "Confidence scale:\n"
+            "- 90-100%: Exceptional business within my circle, trading at attractive price\n"
+            "- 70-89%: Good business with decent moat, fair valuation\n"
+            "- 50-69%: Mixed signals, would need more information or better price\n"
+            "- 30-49%: Outside my expertise or concerning fundamentals\n"
+            "- 10-29%: Poor business or significantly overvalued\n"
+            "\n"
+            "Keep reasoning under 120 characters. Do not invent data. Return JSON only."
+        ),
+        (
+            "human",
+            "Ticker: {ticker}\n"
+            "Facts:\n{facts}\n\n"
+            "Return exactly:\n"
+            "{{\n"
+            '  "signal": "bullish" | "bearish" | "neutral",\n'
+            '  "confidence": int,\n'
+            '  "reasoning": "short justification"\n'
+            "}}"
+        ),
+    ]
+)
+
+
 def generate_buffett_output(
         ticker: str,
         analysis_data: dict[str, any],
@@ -773,49 +818,7 @@ def generate_buffett_output(
         "margin_of_safety": analysis_data.get("margin_of_safety"),
     }
 
-    template = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are Warren Buffett. Decide bullish, bearish, or neutral using only the provided facts.\n"
-                "\n"
-                "Checklist for decision:\n"
-                "- Circle of competence\n"
-                "- Competitive moat\n"
-                "- Management quality\n"
-                "- Financial strength\n"
-                "- Valuation vs intrinsic value\n"
-                "- Long-term prospects\n"
-                "\n"
-                "Signal rules:\n"
-                "- Bullish: strong business AND margin_of_safety > 0.\n"
-                "- Bearish: poor business OR clearly overvalued.\n"
-                "- Neutral: good business but margin_of_safety <= 0, or mixed evidence.\n"
-                "\n"
-                "Confidence scale:\n"
-                "- 90-100%: Exceptional business within my circle, trading at attractive price\n"
-                "- 70-89%: Good business with decent moat, fair valuation\n"
-                "- 50-69%: Mixed signals, would need more information or better price\n"
-                "- 30-49%: Outside my expertise or concerning fundamentals\n"
-                "- 10-29%: Poor business or significantly overvalued\n"
-                "\n"
-                "Keep reasoning under 120 characters. Do not invent data. Return JSON only."
-            ),
-            (
-                "human",
-                "Ticker: {ticker}\n"
-                "Facts:\n{facts}\n\n"
-                "Return exactly:\n"
-                "{{\n"
-                '  "signal": "bullish" | "bearish" | "neutral",\n'
-                '  "confidence": int,\n'
-                '  "reasoning": "short justification"\n'
-                "}}"
-            ),
-        ]
-    )
-
-    prompt = template.invoke({
+    prompt = _PROMPT_TEMPLATE.invoke({
         "facts": json.dumps(facts, separators=(",", ":"), ensure_ascii=False),
         "ticker": ticker,
     })
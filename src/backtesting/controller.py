@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Callable, Sequence, Dict, Any
 
-from .types import AgentOutput, AgentDecisions, PortfolioSnapshot, ActionLiteral, Action
+from .types import AgentOutput, AgentDecisions, PortfolioSnapshot, Action
 from .portfolio import Portfolio
 
 
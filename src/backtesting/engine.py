@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Sequence, Dict
 
@@ -10,7 +12,7 @@ from .controller import AgentController
 from .trader import TradeExecutor
 from .metrics import PerformanceMetricsCalculator
 from .portfolio import Portfolio
-from .types import PerformanceMetrics, PortfolioValuePoint
+from .types import HOLD_DECISION, PerformanceMetrics, PortfolioValuePoint
 from .valuation import calculate_portfolio_value, compute_exposures
 from .output import OutputBuilder
 from .benchmarks import BenchmarkCalculator
@@ -23,6 +25,9 @@ from src.tools.api import (
     get_insider_trades,
 )
 
+# Maximum number of concurrent data fetches while prefetching
+PREFETCH_MAX_WORKERS = 8
+
 
 class BacktestEngine:
     """Coordinates the backtest loop using the new components.
@@ -68,7 +73,8 @@ class BacktestEngine:
         self._benchmark = BenchmarkCalculator()
 
         self._portfolio_values: list[PortfolioValuePoint] = []
-        self._table_rows: list[list] = []
+        # Newest rows first; a deque so each day's rows are prepended without copying the history
+        self._table_rows: deque[list] = deque()
         self._performance_metrics: PerformanceMetrics = {
             "sharpe_ratio": None,
             "sortino_ratio": None,
@@ -80,17 +86,29 @@ class BacktestEngine:
 
     def _prefetch_data(self) -> None:
         end_date_dt = datetime.strptime(self._end_date, "%Y-%m-%d")
-        start_date_dt = end_date_dt - relativedelta(years=1)
+        # Cover at least a year and the first day's one month lookback, so daily
+        # price lookups during the run are served from this single range fetch
+        start_date_dt = min(
+            end_date_dt - relativedelta(years=1),
+            datetime.strptime(self._start_date, "%Y-%m-%d") - relativedelta(months=1),
+        )
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
-        for ticker in self._tickers:
-            get_prices(ticker, start_date_str, self._end_date)
-            get_financial_metrics(ticker, self._end_date, limit=10)
-            get_insider_trades(ticker, self._end_date, start_date=self._start_date, limit=1000)
-            get_company_news(ticker, self._end_date, start_date=self._start_date, limit=1000)
-        
-        # Preload data for SPY for benchmark comparison
-        get_prices("SPY", self._start_date, self._end_date)
+        # The fetches are independent and network bound, so overlap them
+        with ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS) as executor:
+            futures = []
+            for ticker in self._tickers:
+                futures.append(executor.submit(get_prices, ticker, start_date_str, self._end_date))
+                futures.append(executor.submit(get_financial_metrics, ticker, self._end_date, limit=10))
+                futures.append(executor.submit(get_insider_trades, ticker, self._end_date, start_date=self._start_date, limit=1000))
+                futures.append(executor.submit(get_company_news, ticker, self._end_date, start_date=self._start_date, limit=1000))
+
+            # Preload data for SPY for benchmark comparison
+            futures.append(executor.submit(get_prices, "SPY", self._start_date, self._end_date))
+
+            # Surface any fetch error, as the sequential prefetch did
+            for future in futures:
+                future.result()
 
 
     def run_backtest(self) -> PerformanceMetrics:
@@ -143,7 +161,7 @@ class BacktestEngine:
 
             executed_trades: Dict[str, int] = {}
             for ticker in self._tickers:
-                d = decisions.get(ticker, {"action": "hold", "quantity": 0})
+                d = decisions.get(ticker, HOLD_DECISION)
                 action = d.get("action", "hold")
                 qty = d.get("quantity", 0)
                 executed_qty = self._executor.execute_trade(ticker, action, qty, current_prices[ticker], self._portfolio)
@@ -176,7 +194,7 @@ class BacktestEngine:
                 benchmark_return_pct=self._benchmark.get_return_pct("SPY", self._start_date, current_date_str),
             )
             # Prepend today's rows to historical rows so latest day is on top
-            self._table_rows = rows + self._table_rows
+            self._table_rows.extendleft(reversed(rows))
             # Print full history with latest day first (matches backtester.py behavior)
             self._results.print_rows(self._table_rows)
 
@@ -92,7 +92,7 @@ class OutputBuilder:
 
         return date_rows
 
-    def print_rows(self, rows: List[list]) -> None:
+    def print_rows(self, rows: Sequence[list]) -> None:
         print_backtest_results(rows)
 
 
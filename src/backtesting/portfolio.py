@@ -14,6 +14,9 @@ class Portfolio:
     and realized gains/losses calculation.
     """
 
+    # Accessed on every trade and valuation, so skip the per-instance __dict__
+    __slots__ = ("_portfolio",)
+
     def __init__(
         self,
         *,
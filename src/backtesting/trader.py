@@ -7,6 +7,8 @@ from .types import ActionLiteral, Action
 class TradeExecutor:
     """Executes trades against a Portfolio with Backtester-identical semantics."""
 
+    __slots__ = ()
+
     def execute_trade(
         self,
         ticker: str,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Mapping, Optional, Sequence, TypedDict, Literal
+from typing import Any, Dict, Optional, TypedDict, Literal
 from enum import Enum
 
 import pandas as pd
@@ -60,6 +60,9 @@ class AgentDecision(TypedDict):
 
 AgentDecisions = Dict[str, AgentDecision]
 
+# Read-only fallback for tickers the agent returned no decision for
+HOLD_DECISION: AgentDecision = {"action": "hold", "quantity": 0}
+
 
 # Analyst signal payloads can vary by agent; keep as loose dicts
 AnalystSignal = Dict[str, Any]
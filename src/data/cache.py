@@ -7,6 +7,7 @@ class Cache:
         self._line_items_cache: dict[str, list[dict[str, any]]] = {}
         self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
         self._company_news_cache: dict[str, list[dict[str, any]]] = {}
+        self._price_ranges: dict[tuple[str, str], list[tuple[str, str]]] = {}
 
     def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
         """Merge existing and new data, avoiding duplicates based on a key field."""
@@ -17,9 +18,13 @@ class Cache:
         existing_keys = {item[key_field] for item in existing}
 
         # Only add items that don't exist yet
-        merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
-        return merged
+        new_items = [item for item in new_data if item[key_field] not in existing_keys]
+        if not new_items:
+            # Defensive: callers only cache after a miss, but if every record is already held keep
+            # the existing list as is rather than copying it
+            return existing
+
+        return existing + new_items
 
     def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached price data if available."""
@@ -29,6 +34,16 @@ class Cache:
         """Append new price data to cache."""
         self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
 
+    def get_price_ranges(self, ticker: str, data_provider: str) -> list[tuple[str, str]]:
+        """Get the (start_date, end_date) ranges of price data cached for a ticker."""
+        return self._price_ranges.get((ticker, data_provider), [])
+
+    def add_price_range(self, ticker: str, data_provider: str, start_date: str, end_date: str):
+        """Record that price data for the given date range has been cached."""
+        ranges = self._price_ranges.setdefault((ticker, data_provider), [])
+        if (start_date, end_date) not in ranges:
+            ranges.append((start_date, end_date))
+
     def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
         """Get cached financial metrics if available."""
         return self._financial_metrics_cache.get(ticker)
@@ -55,6 +55,12 @@ DATA_SOURCE_ORDER = [
     ),
 ]
 
+# Agent-specific default data providers, used when the request doesn't specify one
+AGENT_DEFAULT_DATA_PROVIDERS = {
+    "technicals_agent": "financial_datasets",
+    "technical_analyst_agent": "financial_datasets",
+}
+
 
 def get_data_source_info(provider_key: str) -> DataSourceModel:
     """Get data source configuration by key"""
@@ -86,13 +92,8 @@ def get_data_provider_for_agent(state: dict, agent_id: str = None) -> str:
         return data_provider
     
     # Agent-specific defaults (if needed)
-    agent_specific_defaults = {
-        "technicals_agent": "financial_datasets",
-        "technical_analyst_agent": "financial_datasets",
-    }
-    
-    if agent_id and agent_id in agent_specific_defaults:
-        return agent_specific_defaults[agent_id]
+    if agent_id and (agent_default := AGENT_DEFAULT_DATA_PROVIDERS.get(agent_id)):
+        return agent_default
     
     # System default
     return get_default_data_provider()
\ No newline at end of file
@@ -1,19 +1,25 @@
+from __future__ import annotations
+
 import os
 import json
-from langchain_anthropic import ChatAnthropic
-from langchain_deepseek import ChatDeepSeek
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
-from langchain_xai import ChatXAI
-from langchain_openai import ChatOpenAI, AzureChatOpenAI
-from langchain_openai import ChatOpenAI
-from langchain_gigachat import GigaChat
-from langchain_ollama import ChatOllama
 from enum import Enum
+from functools import lru_cache
 from pydantic import BaseModel
-from typing import Tuple, List
+from typing import TYPE_CHECKING, Tuple, List
 from pathlib import Path
 
+# Each provider SDK takes a noticeable time to import, so they are imported inside the
+# builder for that provider and only the one actually used is ever loaded
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_deepseek import ChatDeepSeek
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_groq import ChatGroq
+    from langchain_xai import ChatXAI
+    from langchain_openai import ChatOpenAI, AzureChatOpenAI
+    from langchain_gigachat import GigaChat
+    from langchain_ollama import ChatOllama
+
 
 class ModelProvider(str, Enum):
     """Enum for supported LLM providers"""
@@ -111,10 +117,18 @@ LLM_ORDER = [model.to_choice_tuple() for model in AVAILABLE_MODELS]
 OLLAMA_LLM_ORDER = [model.to_choice_tuple() for model in OLLAMA_MODELS]
 
 
+# Index of (model_name, provider value) -> model, so lookups don't scan both model lists.
+# Built in reverse so the first listed model wins for a key, as with a linear search.
+_MODEL_INDEX: dict[tuple[str, str], LLMModel] = {
+    (model.model_name, model.provider.value): model for model in reversed(AVAILABLE_MODELS + OLLAMA_MODELS)
+}
+
+
 def get_model_info(model_name: str, model_provider: str) -> LLMModel | None:
     """Get model information by model_name"""
-    all_models = AVAILABLE_MODELS + OLLAMA_MODELS
-    return next((model for model in all_models if model.model_name == model_name and model.provider == model_provider), None)
+    # Key on the provider's string value: a str-based Enum member doesn't hash like its value
+    provider = model_provider.value if isinstance(model_provider, ModelProvider) else model_provider
+    return _MODEL_INDEX.get((model_name, provider))
 
 
 def get_models_list():
@@ -129,106 +143,173 @@ def get_models_list():
     ]
 
 
-def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
-    if model_provider == ModelProvider.GROQ:
-        api_key = (api_keys or {}).get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
-        if not api_key:
-            # Print error to console
-            print(f"API Key Error: Please make sure GROQ_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("Groq API key not found.  Please make sure GROQ_API_KEY is set in your .env file or provided via API keys.")
-        return ChatGroq(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.OPENAI:
-        # Get and validate API key
-        api_key = (api_keys or {}).get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
-        base_url = os.getenv("OPENAI_API_BASE")
-        if not api_key:
-            # Print error to console
-            print(f"API Key Error: Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("OpenAI API key not found.  Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
-        return ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url)
-    elif model_provider == ModelProvider.ANTHROPIC:
-        api_key = (api_keys or {}).get("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure ANTHROPIC_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("Anthropic API key not found.  Please make sure ANTHROPIC_API_KEY is set in your .env file or provided via API keys.")
-        return ChatAnthropic(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.DEEPSEEK:
-        api_key = (api_keys or {}).get("DEEPSEEK_API_KEY") or os.getenv("DEEPSEEK_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure DEEPSEEK_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("DeepSeek API key not found.  Please make sure DEEPSEEK_API_KEY is set in your .env file or provided via API keys.")
-        return ChatDeepSeek(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.GOOGLE:
-        api_key = (api_keys or {}).get("GOOGLE_API_KEY") or os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure GOOGLE_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("Google API key not found.  Please make sure GOOGLE_API_KEY is set in your .env file or provided via API keys.")
-        return ChatGoogleGenerativeAI(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.OLLAMA:
-        # For Ollama, we use a base URL instead of an API key
-        # Check if OLLAMA_HOST is set (for Docker on macOS)
-        ollama_host = os.getenv("OLLAMA_HOST", "localhost")
-        base_url = os.getenv("OLLAMA_BASE_URL", f"http://{ollama_host}:11434")
-        return ChatOllama(
-            model=model_name,
-            base_url=base_url,
-            timeout=120,  # 2 minute timeout to prevent hanging
-            temperature=0.1,  # Lower temperature for more consistent JSON output
-        )
-    elif model_provider == ModelProvider.OPENROUTER:
-        api_key = (api_keys or {}).get("OPENROUTER_API_KEY") or os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure OPENROUTER_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("OpenRouter API key not found. Please make sure OPENROUTER_API_KEY is set in your .env file or provided via API keys.")
-        
-        # Get optional site URL and name for headers
-        site_url = os.getenv("YOUR_SITE_URL", "https://github.com/virattt/ai-hedge-fund")
-        site_name = os.getenv("YOUR_SITE_NAME", "AI Hedge Fund")
-        
-        return ChatOpenAI(
-            model=model_name,
-            openai_api_key=api_key,
-            openai_api_base="https://openrouter.ai/api/v1",
-            model_kwargs={
-                "extra_headers": {
-                    "HTTP-Referer": site_url,
-                    "X-Title": site_name,
-                }
+def _get_groq_model(model_name: str, api_keys: dict) -> ChatGroq:
+    from langchain_groq import ChatGroq
+    api_key = api_keys.get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
+    if not api_key:
+        # Print error to console
+        print(f"API Key Error: Please make sure GROQ_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("Groq API key not found.  Please make sure GROQ_API_KEY is set in your .env file or provided via API keys.")
+    return ChatGroq(model=model_name, api_key=api_key)
+
+
+def _get_openai_model(model_name: str, api_keys: dict) -> ChatOpenAI:
+    from langchain_openai import ChatOpenAI
+    # Get and validate API key
+    api_key = api_keys.get("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
+    base_url = os.getenv("OPENAI_API_BASE")
+    if not api_key:
+        # Print error to console
+        print(f"API Key Error: Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("OpenAI API key not found.  Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
+    return ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url)
+
+
+def _get_anthropic_model(model_name: str, api_keys: dict) -> ChatAnthropic:
+    from langchain_anthropic import ChatAnthropic
+    api_key = api_keys.get("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        print(f"API Key Error: Please make sure ANTHROPIC_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("Anthropic API key not found.  Please make sure ANTHROPIC_API_KEY is set in your .env file or provided via API keys.")
+    return ChatAnthropic(model=model_name, api_key=api_key)
+
+
+def _get_deepseek_model(model_name: str, api_keys: dict) -> ChatDeepSeek:
+    from langchain_deepseek import ChatDeepSeek
+    api_key = api_keys.get("DEEPSEEK_API_KEY") or os.getenv("DEEPSEEK_API_KEY")
+    if not api_key:
+        print(f"API Key Error: Please make sure DEEPSEEK_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("DeepSeek API key not found.  Please make sure DEEPSEEK_API_KEY is set in your .env file or provided via API keys.")
+    return ChatDeepSeek(model=model_name, api_key=api_key)
+
+
+def _get_google_model(model_name: str, api_keys: dict) -> ChatGoogleGenerativeAI:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    api_key = api_keys.get("GOOGLE_API_KEY") or os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        print(f"API Key Error: Please make sure GOOGLE_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("Google API key not found.  Please make sure GOOGLE_API_KEY is set in your .env file or provided via API keys.")
+    return ChatGoogleGenerativeAI(model=model_name, api_key=api_key)
+
+
+def _get_ollama_model(model_name: str, api_keys: dict) -> ChatOllama:
+    from langchain_ollama import ChatOllama
+    # For Ollama, we use a base URL instead of an API key
+    # Check if OLLAMA_HOST is set (for Docker on macOS)
+    ollama_host = os.getenv("OLLAMA_HOST", "localhost")
+    base_url = os.getenv("OLLAMA_BASE_URL", f"http://{ollama_host}:11434")
+    return ChatOllama(
+        model=model_name,
+        base_url=base_url,
+        timeout=120,  # 2 minute timeout to prevent hanging
+        temperature=0.1,  # Lower temperature for more consistent JSON output
+    )
+
+
+def _get_openrouter_model(model_name: str, api_keys: dict) -> ChatOpenAI:
+    from langchain_openai import ChatOpenAI
+    api_key = api_keys.get("OPENROUTER_API_KEY") or os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        print(f"API Key Error: Please make sure OPENROUTER_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("OpenRouter API key not found. Please make sure OPENROUTER_API_KEY is set in your .env file or provided via API keys.")
+
+    # Get optional site URL and name for headers
+    site_url = os.getenv("YOUR_SITE_URL", "https://github.com/virattt/ai-hedge-fund")
+    site_name = os.getenv("YOUR_SITE_NAME", "AI Hedge Fund")
+
+    return ChatOpenAI(
+        model=model_name,
+        openai_api_key=api_key,
+        openai_api_base="https://openrouter.ai/api/v1",
+        model_kwargs={
+            "extra_headers": {
+                "HTTP-Referer": site_url,
+                "X-Title": site_name,
             }
-        )
-    elif model_provider == ModelProvider.XAI:
-        api_key = (api_keys or {}).get("XAI_API_KEY") or os.getenv("XAI_API_KEY")
-        if not api_key:
-            print(f"API Key Error: Please make sure XAI_API_KEY is set in your .env file or provided via API keys.")
-            raise ValueError("xAI API key not found. Please make sure XAI_API_KEY is set in your .env file or provided via API keys.")
-        return ChatXAI(model=model_name, api_key=api_key)
-    elif model_provider == ModelProvider.GIGACHAT:
-        if os.getenv("GIGACHAT_USER") or os.getenv("GIGACHAT_PASSWORD"):
-            return GigaChat(model=model_name)
-        else: 
-            api_key = (api_keys or {}).get("GIGACHAT_API_KEY") or os.getenv("GIGACHAT_API_KEY") or os.getenv("GIGACHAT_CREDENTIALS")
-            if not api_key:
-                print("API Key Error: Please make sure api_keys is set in your .env file or provided via API keys.")
-                raise ValueError("GigaChat API key not found. Please make sure GIGACHAT_API_KEY is set in your .env file or provided via API keys.")
-
-            return GigaChat(credentials=api_key, model=model_name)
-    elif model_provider == ModelProvider.AZURE_OPENAI:
-        # Get and validate API key
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        if not api_key:
-            # Print error to console
-            print(f"API Key Error: Please make sure AZURE_OPENAI_API_KEY is set in your .env file.")
-            raise ValueError("Azure OpenAI API key not found.  Please make sure AZURE_OPENAI_API_KEY is set in your .env file.")
-        # Get and validate Azure Endpoint
-        azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-        if not azure_endpoint:
-            # Print error to console
-            print(f"Azure Endpoint Error: Please make sure AZURE_OPENAI_ENDPOINT is set in your .env file.")
-            raise ValueError("Azure OpenAI endpoint not found.  Please make sure AZURE_OPENAI_ENDPOINT is set in your .env file.")
-        # get and validate deployment name
-        azure_deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-        if not azure_deployment_name:
-            # Print error to console
-            print(f"Azure Deployment Name Error: Please make sure AZURE_OPENAI_DEPLOYMENT_NAME is set in your .env file.")
-            raise ValueError("Azure OpenAI deployment name not found.  Please make sure AZURE_OPENAI_DEPLOYMENT_NAME is set in your .env file.")
-        return AzureChatOpenAI(azure_endpoint=azure_endpoint, azure_deployment=azure_deployment_name, api_key=api_key, api_version="2024-10-21")
+        }
+    )
+
+
+def _get_xai_model(model_name: str, api_keys: dict) -> ChatXAI:
+    from langchain_xai import ChatXAI
+    api_key = api_keys.get("XAI_API_KEY") or os.getenv("XAI_API_KEY")
+    if not api_key:
+        print(f"API Key Error: Please make sure XAI_API_KEY is set in your .env file or provided via API keys.")
+        raise ValueError("xAI API key not found. Please make sure XAI_API_KEY is set in your .env file or provided via API keys.")
+    return ChatXAI(model=model_name, api_key=api_key)
+
+
+def _get_gigachat_model(model_name: str, api_keys: dict) -> GigaChat:
+    from langchain_gigachat import GigaChat
+    if os.getenv("GIGACHAT_USER") or os.getenv("GIGACHAT_PASSWORD"):
+        return GigaChat(model=model_name)
+
+    api_key = api_keys.get("GIGACHAT_API_KEY") or os.getenv("GIGACHAT_API_KEY") or os.getenv("GIGACHAT_CREDENTIALS")
+    if not api_key:
+        print("API Key Error: Please make sure api_keys is set in your .env file or provided via API keys.")
+        raise ValueError("GigaChat API key not found. Please make sure GIGACHAT_API_KEY is set in your .env file or provided via API keys.")
+
+    return GigaChat(credentials=api_key, model=model_name)
+
+
+def _get_azure_openai_model(model_name: str, api_keys: dict) -> AzureChatOpenAI:
+    from langchain_openai import AzureChatOpenAI
+    # Get and validate API key
+    api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    if not api_key:
+        # Print error to console
+        print(f"API Key Error: Please make sure AZURE_OPENAI_API_KEY is set in your .env file.")
+        raise ValueError("Azure OpenAI API key not found.  Please make sure AZURE_OPENAI_API_KEY is set in your .env file.")
+    # Get and validate Azure Endpoint
+    azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+    if not azure_endpoint:
+        # Print error to console
+        print(f"Azure Endpoint Error: Please make sure AZURE_OPENAI_ENDPOINT is set in your .env file.")
+        raise ValueError("Azure OpenAI endpoint not found.  Please make sure AZURE_OPENAI_ENDPOINT is set in your .env file.")
+    # get and validate deployment name
+    azure_deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+    if not azure_deployment_name:
+        # Print error to console
+        print(f"Azure Deployment Name Error: Please make sure AZURE_OPENAI_DEPLOYMENT_NAME is set in your .env file.")
+        raise ValueError("Azure OpenAI deployment name not found.  Please make sure AZURE_OPENAI_DEPLOYMENT_NAME is set in your .env file.")
+    return AzureChatOpenAI(azure_endpoint=azure_endpoint, azure_deployment=azure_deployment_name, api_key=api_key, api_version="2024-10-21")
+
+
+# Map of provider -> function building a chat model for it
+_MODEL_BUILDERS = {
+    ModelProvider.GROQ: _get_groq_model,
+    ModelProvider.OPENAI: _get_openai_model,
+    ModelProvider.ANTHROPIC: _get_anthropic_model,
+    ModelProvider.DEEPSEEK: _get_deepseek_model,
+    ModelProvider.GOOGLE: _get_google_model,
+    ModelProvider.OLLAMA: _get_ollama_model,
+    ModelProvider.OPENROUTER: _get_openrouter_model,
+    ModelProvider.XAI: _get_xai_model,
+    ModelProvider.GIGACHAT: _get_gigachat_model,
+    ModelProvider.AZURE_OPENAI: _get_azure_openai_model,
+}
+
+
+def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
+    try:
+        # Providers may arrive as plain strings; normalise so the lookup matches the enum keys
+        builder = _MODEL_BUILDERS.get(ModelProvider(model_provider))
+    except ValueError:
+        return None
+    if builder is None:
+        return None
+    return builder(model_name, api_keys or {})
+
+
+@lru_cache(maxsize=32)
+def _get_cached_model(model_name: str, model_provider: ModelProvider, api_keys: tuple[tuple[str, str], ...]):
+    return get_model(model_name, model_provider, dict(api_keys))
+
+
+def get_cached_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | GigaChat | None:
+    """Get a chat model, reusing the client built for the same model, provider and API keys.
+
+    Building a client sets up the provider SDK and its HTTP connection pool, which is
+    wasted work when every agent makes several LLM calls with the same configuration.
+    """
+    return _get_cached_model(model_name, model_provider, tuple(sorted((api_keys or {}).items())))
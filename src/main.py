@@ -1,25 +1,17 @@
-import sys
-
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage
 from langgraph.graph import END, StateGraph
-from colorama import Fore, Style, init
-import questionary
+from colorama import init
 from src.agents.portfolio_manager import portfolio_management_agent
 from src.agents.risk_manager import risk_management_agent
 from src.graph.state import AgentState
 from src.utils.display import print_trading_output
-from src.utils.analysts import ANALYST_ORDER, get_analyst_nodes
+from src.utils.analysts import get_analyst_nodes
 from src.utils.progress import progress
-from src.utils.visualize import save_graph_as_png
 from src.cli.input import (
     parse_cli_inputs,
 )
-from src.data.providers import DATA_SOURCE_ORDER, get_data_source_info
 
-import argparse
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 import json
 
 # Load environment variables from .env file
@@ -1,8 +1,12 @@
 import datetime
+import functools
 import os
 import pandas as pd
 import requests
+import threading
 import time
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
 try:
     import yfinance as yf
     YFINANCE_AVAILABLE = True
@@ -10,7 +14,6 @@ except ImportError:
     YFINANCE_AVAILABLE = False
 
 from src.data.cache import get_cache
-from src.data.providers import DataProvider
 from src.data.models import (
     CompanyNews,
     CompanyNewsResponse,
@@ -28,6 +31,61 @@ from src.data.models import (
 # Global cache instance
 _cache = get_cache()
 
+# Shared HTTP session so requests reuse pooled keep-alive connections instead of
+# paying a new TCP + TLS handshake each time. The pool is sized for the analyst
+# agents fetching in parallel.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+# Fetches currently in progress, keyed by function and arguments
+_inflight: dict[tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(func):
+    """
+    Coalesce concurrent identical calls into a single fetch.
+
+    Analyst agents run in parallel and typically request the same ticker data at
+    the same time. Without this, each of them misses the cache and issues its own
+    API request; with it, the first caller fetches and the others wait for its result.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, repr((args, sorted(kwargs.items()))))
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = _inflight[key] = Future()
+
+        if not is_leader:
+            return list(future.result())
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+
+    return wrapper
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Return the delay requested by a response's Retry-After header, if it gives one in seconds."""
+    try:
+        delay = float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+    return delay if 0 <= delay < float("inf") else None
+
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
@@ -48,13 +106,15 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     """
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = _session.post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers)
+            response = _session.get(url, headers=headers)
         
         if response.status_code == 429 and attempt < max_retries:
-            # Linear backoff: 60s, 90s, 120s, 150s...
-            delay = 60 + (30 * attempt)
+            # Wait as long as the server asks to, otherwise linear backoff: 60s, 90s, 120s, 150s...
+            delay = _retry_after_seconds(response)
+            if delay is None:
+                delay = 60 + (30 * attempt)
             print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
             time.sleep(delay)
             continue
@@ -94,6 +154,30 @@ def get_prices_yfinance(ticker: str, start_date: str, end_date: str) -> list[Pri
         raise Exception(f"Error fetching data from Yahoo Finance for {ticker}: {str(e)}")
 
 
+def _get_cached_price_subrange(ticker: str, start_date: str, end_date: str, data_provider: str) -> list[dict] | None:
+    """
+    Serve a price request from a previously fetched range that covers it.
+
+    A backtest prefetches one long price range per ticker and then asks for a
+    short window every day; slicing the cached range avoids one API round-trip
+    per ticker per day.
+    """
+    for range_start, range_end in _cache.get_price_ranges(ticker, data_provider):
+        # Require the cached range to extend past end_date so its last day is complete
+        # regardless of whether the provider treats end dates as inclusive or exclusive
+        if not (range_start <= start_date and end_date < range_end):
+            continue
+        cached_data = _cache.get_prices(f"{ticker}_{range_start}_{range_end}_{data_provider}")
+        if not cached_data:
+            continue
+        # yfinance treats the end date as exclusive, Financial Datasets as inclusive
+        if data_provider == "yfinance":
+            return [p for p in cached_data if start_date <= p["time"][:10] < end_date]
+        return [p for p in cached_data if start_date <= p["time"][:10] <= end_date]
+    return None
+
+
+@_single_flight
 def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None, data_provider: str = "financial_datasets") -> list[Price]:
     """Fetch price data from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
@@ -103,6 +187,10 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None,
     if cached_data := _cache.get_prices(cache_key):
         return [Price(**price) for price in cached_data]
 
+    # Then check for a cached range covering the requested window
+    if cached_data := _get_cached_price_subrange(ticker, start_date, end_date, data_provider):
+        return [Price(**price) for price in cached_data]
+
     # Route to appropriate data provider
     if data_provider == "yfinance":
         prices = get_prices_yfinance(ticker, start_date, end_date)
@@ -118,8 +206,8 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None,
         if response.status_code != 200:
             raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-        # Parse response with Pydantic model
-        price_response = PriceResponse(**response.json())
+        # Validate the raw body directly so pydantic-core parses the JSON in one pass
+        price_response = PriceResponse.model_validate_json(response.content)
         prices = price_response.prices
 
     if not prices:
@@ -127,6 +215,7 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None,
 
     # Cache the results using the comprehensive cache key
     _cache.set_prices(cache_key, [p.model_dump() for p in prices])
+    _cache.add_price_range(ticker, data_provider, start_date, end_date)
     return prices
 
 
@@ -240,6 +329,7 @@ def get_financial_metrics_yfinance(ticker: str, end_date: str = None) -> list[Fi
         raise Exception(f"Error fetching financial metrics from Yahoo Finance for {ticker}: {str(e)}")
 
 
+@_single_flight
 def get_financial_metrics(
     ticker: str,
     end_date: str,
@@ -271,8 +361,8 @@ def get_financial_metrics(
         if response.status_code != 200:
             raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-        # Parse response with Pydantic model
-        metrics_response = FinancialMetricsResponse(**response.json())
+        # Validate the raw body directly so pydantic-core parses the JSON in one pass
+        metrics_response = FinancialMetricsResponse.model_validate_json(response.content)
         financial_metrics = metrics_response.financial_metrics
 
     if not financial_metrics:
@@ -413,6 +503,7 @@ def search_line_items_yfinance(
         raise Exception(f"Error fetching line items from Yahoo Finance for {ticker}: {str(e)}")
 
 
+@_single_flight
 def search_line_items(
     ticker: str,
     line_items: list[str],
@@ -423,9 +514,17 @@ def search_line_items(
     data_provider: str = "financial_datasets",
 ) -> list[LineItem]:
     """Fetch line items from cache or API."""
+    # Create a cache key that includes all parameters to ensure exact matches
+    # (line items are sorted so the same set requested in a different order hits the cache)
+    cache_key = f"{ticker}_{','.join(sorted(line_items))}_{period}_{end_date}_{limit}_{data_provider}"
+
+    # Check cache first - simple exact match
+    if cached_data := _cache.get_line_items(cache_key):
+        return [LineItem(**item) for item in cached_data]
+
     # Route to appropriate data provider
     if data_provider == "yfinance":
-        return search_line_items_yfinance(ticker, line_items, end_date, period, limit)
+        search_results = search_line_items_yfinance(ticker, line_items, end_date, period, limit)
     else:
         # Default to Financial Datasets API
         headers = {}
@@ -445,14 +544,15 @@ def search_line_items(
         response = _make_api_request(url, headers, method="POST", json_data=body)
         if response.status_code != 200:
             raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
-        data = response.json()
-        response_model = LineItemResponse(**data)
-        search_results = response_model.search_results
-        if not search_results:
-            return []
+        response_model = LineItemResponse.model_validate_json(response.content)
+        search_results = response_model.search_results[:limit]
 
-        # Cache the results
-        return search_results[:limit]
+    if not search_results:
+        return []
+
+    # Cache the results using the comprehensive cache key
+    _cache.set_line_items(cache_key, [item.model_dump() for item in search_results])
+    return search_results
 
 
 def get_insider_trades_yfinance(
@@ -473,7 +573,8 @@ def get_insider_trades_yfinance(
             return []
         
         trades = []
-        for _, row in insider_data.iterrows():
+        # Only build models for the rows that will be returned
+        for _, row in insider_data.head(limit).iterrows():
             # Basic data mapping - yfinance has limited insider trade details
             trade = InsiderTrade(
                 ticker=ticker,
@@ -492,7 +593,7 @@ def get_insider_trades_yfinance(
             )
             trades.append(trade)
         
-        return trades[:limit]
+        return trades
         
     except Exception as e:
         # Return empty list instead of raising exception for non-critical data
@@ -500,6 +601,7 @@ def get_insider_trades_yfinance(
         return []
 
 
+@_single_flight
 def get_insider_trades(
     ticker: str,
     end_date: str,
@@ -539,8 +641,7 @@ def get_insider_trades(
             if response.status_code != 200:
                 raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-            data = response.json()
-            response_model = InsiderTradeResponse(**data)
+            response_model = InsiderTradeResponse.model_validate_json(response.content)
             insider_trades = response_model.insider_trades
 
             if not insider_trades:
@@ -607,6 +708,7 @@ def get_company_news_yfinance(
         return []
 
 
+@_single_flight
 def get_company_news(
     ticker: str,
     end_date: str,
@@ -646,8 +748,7 @@ def get_company_news(
             if response.status_code != 200:
                 raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-            data = response.json()
-            response_model = CompanyNewsResponse(**data)
+            response_model = CompanyNewsResponse.model_validate_json(response.content)
             company_news = response_model.news
 
             if not company_news:
@@ -715,8 +816,7 @@ def get_market_cap(
                 print(f"Error fetching company facts: {ticker} - {response.status_code}")
                 return None
 
-            data = response.json()
-            response_model = CompanyFactsResponse(**data)
+            response_model = CompanyFactsResponse.model_validate_json(response.content)
             return response_model.company_facts.market_cap
 
         financial_metrics = get_financial_metrics(ticker, end_date, api_key=api_key, data_provider=data_provider)
@@ -733,7 +833,8 @@ def get_market_cap(
 
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
+    # Build column arrays straight from the model attributes instead of a dict per price
+    df = pd.DataFrame({field: [getattr(p, field) for p in prices] for field in Price.model_fields})
     df["Date"] = pd.to_datetime(df["time"])
     df.set_index("Date", inplace=True)
     numeric_cols = ["open", "close", "high", "low", "volume"]
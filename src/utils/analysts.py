@@ -1,22 +1,6 @@
 """Constants and utilities related to analysts configuration."""
 
-from src.agents import portfolio_manager
-from src.agents.aswath_damodaran import aswath_damodaran_agent
-from src.agents.ben_graham import ben_graham_agent
-from src.agents.bill_ackman import bill_ackman_agent
-from src.agents.cathie_wood import cathie_wood_agent
-from src.agents.charlie_munger import charlie_munger_agent
-from src.agents.fundamentals import fundamentals_analyst_agent
-from src.agents.michael_burry import michael_burry_agent
-from src.agents.phil_fisher import phil_fisher_agent
-from src.agents.peter_lynch import peter_lynch_agent
-from src.agents.sentiment import sentiment_analyst_agent
-from src.agents.stanley_druckenmiller import stanley_druckenmiller_agent
-from src.agents.technicals import technical_analyst_agent
-from src.agents.valuation import valuation_analyst_agent
-from src.agents.warren_buffett import warren_buffett_agent
-from src.agents.rakesh_jhunjhunwala import rakesh_jhunjhunwala_agent
-from src.agents.mohnish_pabrai import mohnish_pabrai_agent
+from src.agents import get_agent
 
 # Define analyst configuration - single source of truth
 ANALYST_CONFIG = {
@@ -24,7 +8,6 @@ ANALYST_CONFIG = {
         "display_name": "Aswath Damodaran",
         "description": "The Dean of Valuation",
         "investing_style": "Focuses on intrinsic value and financial metrics to assess investment opportunities through rigorous valuation analysis.",
-        "agent_func": aswath_damodaran_agent,
         "type": "analyst",
         "order": 0,
     },
@@ -32,7 +15,6 @@ ANALYST_CONFIG = {
         "display_name": "Ben Graham",
         "description": "The Father of Value Investing",
         "investing_style": "Emphasizes a margin of safety and invests in undervalued companies with strong fundamentals through systematic value analysis.",
-        "agent_func": ben_graham_agent,
         "type": "analyst",
         "order": 1,
     },
@@ -40,7 +22,6 @@ ANALYST_CONFIG = {
         "display_name": "Bill Ackman",
         "description": "The Activist Investor",
         "investing_style": "Seeks to influence management and unlock value through strategic activism and contrarian investment positions.",
-        "agent_func": bill_ackman_agent,
         "type": "analyst",
         "order": 2,
     },
@@ -48,7 +29,6 @@ ANALYST_CONFIG = {
         "display_name": "Cathie Wood",
         "description": "The Queen of Growth Investing",
         "investing_style": "Focuses on disruptive innovation and growth, investing in companies that are leading technological advancements and market disruption.",
-        "agent_func": cathie_wood_agent,
         "type": "analyst",
         "order": 3,
     },
@@ -56,7 +36,6 @@ ANALYST_CONFIG = {
         "display_name": "Charlie Munger",
         "description": "The Rational Thinker",
         "investing_style": "Advocates for value investing with a focus on quality businesses and long-term growth through rational decision-making.",
-        "agent_func": charlie_munger_agent,
         "type": "analyst",
         "order": 4,
     },
@@ -64,7 +43,6 @@ ANALYST_CONFIG = {
         "display_name": "Michael Burry",
         "description": "The Big Short Contrarian",
         "investing_style": "Makes contrarian bets, often shorting overvalued markets and investing in undervalued assets through deep fundamental analysis.",
-        "agent_func": michael_burry_agent,
         "type": "analyst",
         "order": 5,
     },
@@ -72,7 +50,6 @@ ANALYST_CONFIG = {
         "display_name": "Mohnish Pabrai",
         "description": "The Dhandho Investor",
         "investing_style": "Focuses on value investing and long-term growth through fundamental analysis and a margin of safety.",
-        "agent_func": mohnish_pabrai_agent,
         "type": "analyst",
         "order": 6,
     },
@@ -80,7 +57,6 @@ ANALYST_CONFIG = {
         "display_name": "Peter Lynch",
         "description": "The 10-Bagger Investor",
         "investing_style": "Invests in companies with understandable business models and strong growth potential using the 'buy what you know' strategy.",
-        "agent_func": peter_lynch_agent,
         "type": "analyst",
         "order": 6,
     },
@@ -88,7 +64,6 @@ ANALYST_CONFIG = {
         "display_name": "Phil Fisher",
         "description": "The Scuttlebutt Investor",
         "investing_style": "Emphasizes investing in companies with strong management and innovative products, focusing on long-term growth through scuttlebutt research.",
-        "agent_func": phil_fisher_agent,
         "type": "analyst",
         "order": 7,
     },
@@ -96,7 +71,6 @@ ANALYST_CONFIG = {
         "display_name": "Rakesh Jhunjhunwala",
         "description": "The Big Bull Of India",
         "investing_style": "Leverages macroeconomic insights to invest in high-growth sectors, particularly within emerging markets and domestic opportunities.",
-        "agent_func": rakesh_jhunjhunwala_agent,
         "type": "analyst",
         "order": 8,
     },
@@ -104,7 +78,6 @@ ANALYST_CONFIG = {
         "display_name": "Stanley Druckenmiller",
         "description": "The Macro Investor",
         "investing_style": "Focuses on macroeconomic trends, making large bets on currencies, commodities, and interest rates through top-down analysis.",
-        "agent_func": stanley_druckenmiller_agent,
         "type": "analyst",
         "order": 9,
     },
@@ -112,7 +85,6 @@ ANALYST_CONFIG = {
         "display_name": "Warren Buffett",
         "description": "The Oracle of Omaha",
         "investing_style": "Seeks companies with strong fundamentals and competitive advantages through value investing and long-term ownership.",
-        "agent_func": warren_buffett_agent,
         "type": "analyst",
         "order": 10,
     },
@@ -120,7 +92,6 @@ ANALYST_CONFIG = {
         "display_name": "Technical Analyst",
         "description": "Chart Pattern Specialist",
         "investing_style": "Focuses on chart patterns and market trends to make investment decisions, often using technical indicators and price action analysis.",
-        "agent_func": technical_analyst_agent,
         "type": "analyst",
         "order": 11,
     },
@@ -128,7 +99,6 @@ ANALYST_CONFIG = {
         "display_name": "Fundamentals Analyst",
         "description": "Financial Statement Specialist",
         "investing_style": "Delves into financial statements and economic indicators to assess the intrinsic value of companies through fundamental analysis.",
-        "agent_func": fundamentals_analyst_agent,
         "type": "analyst",
         "order": 12,
     },
@@ -136,7 +106,6 @@ ANALYST_CONFIG = {
         "display_name": "Sentiment Analyst",
         "description": "Market Sentiment Specialist",
         "investing_style": "Gauges market sentiment and investor behavior to predict market movements and identify opportunities through behavioral analysis.",
-        "agent_func": sentiment_analyst_agent,
         "type": "analyst",
         "order": 13,
     },
@@ -144,7 +113,6 @@ ANALYST_CONFIG = {
         "display_name": "Valuation Analyst",
         "description": "Company Valuation Specialist",
         "investing_style": "Specializes in determining the fair value of companies, using various valuation models and financial metrics for investment decisions.",
-        "agent_func": valuation_analyst_agent,
         "type": "analyst",
         "order": 14,
     },
@@ -156,18 +124,23 @@ ANALYST_ORDER = [(config["display_name"], key) for key, config in sorted(ANALYST
 
 def get_analyst_nodes():
     """Get the mapping of analyst keys to their (node_name, agent_func) tuples."""
-    return {key: (f"{key}_agent", config["agent_func"]) for key, config in ANALYST_CONFIG.items()}
+    return {key: (f"{key}_agent", get_agent(key)) for key in ANALYST_CONFIG}
+
+
+# The agents list is static, so build it once rather than re-sorting the config per request
+_AGENTS_LIST = tuple(
+    {
+        "key": key,
+        "display_name": config["display_name"],
+        "description": config["description"],
+        "investing_style": config["investing_style"],
+        "order": config["order"]
+    }
+    for key, config in sorted(ANALYST_CONFIG.items(), key=lambda x: x[1]["order"])
+)
 
 
 def get_agents_list():
     """Get the list of agents for API responses."""
-    return [
-        {
-            "key": key,
-            "display_name": config["display_name"],
-            "description": config["description"],
-            "investing_style": config["investing_style"],
-            "order": config["order"]
-        }
-        for key, config in sorted(ANALYST_CONFIG.items(), key=lambda x: x[1]["order"])
-    ]
+    # Copy the entries too, so a caller modifying one can't change what later requests see
+    return [dict(agent) for agent in _AGENTS_LIST]
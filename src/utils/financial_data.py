@@ -1,6 +1,6 @@
 """Utilities for safe financial data access."""
 
-from typing import Any, Union, Optional
+from typing import Any, Optional, Sequence, Union
 from src.data.models import LineItem, FinancialMetrics
 
 
@@ -103,23 +103,17 @@ def calculate_shareholders_equity(data_item: Union[LineItem, FinancialMetrics])
 
 def validate_required_fields(
     data_item: Union[LineItem, FinancialMetrics], 
-    required_fields: list[str]
+    required_fields: Sequence[str]
 ) -> tuple[bool, list[str]]:
     """
     Validate that required fields are present and not None.
     
     Args:
         data_item: Financial data item to validate
-        required_fields: List of required field names
+        required_fields: Sequence of required field names
         
     Returns:
         Tuple of (is_valid, missing_fields)
     """
-    missing_fields = []
-    
-    for field in required_fields:
-        value = safe_get_field(data_item, field)
-        if value is None:
-            missing_fields.append(field)
-    
-    return len(missing_fields) == 0, missing_fields
\ No newline at end of file
+    missing_fields = [field for field in required_fields if safe_get_field(data_item, field) is None]
+    return not missing_fields, missing_fields
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import json
 from pydantic import BaseModel
-from src.llm.models import get_model, get_model_info
+from src.llm.models import get_cached_model, get_model_info
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
@@ -46,7 +46,7 @@ def call_llm(
             api_keys = request.api_keys
 
     model_info = get_model_info(model_name, model_provider)
-    llm = get_model(model_name, model_provider, api_keys)
+    llm = get_cached_model(model_name, model_provider, api_keys)
 
     # For models that support JSON mode, use structured output
     if model_info and model_info.has_json_mode():
@@ -127,11 +127,15 @@ def extract_json_from_response(content: str) -> dict | None:
         return None
         
     try:
-        # Try to parse the entire content as JSON first (in case it's pure JSON)
-        try:
-            return json.loads(content.strip())
-        except json.JSONDecodeError:
-            pass
+        # Try to parse the entire content as JSON first (in case it's pure JSON).
+        # Most responses are markdown-wrapped, so only attempt it when the text
+        # can actually be a JSON document.
+        stripped = content.strip()
+        if stripped[:1] in ("{", "["):
+            try:
+                return json.loads(stripped)
+            except json.JSONDecodeError:
+                pass
         
         # Try to find JSON block with multiple patterns
         patterns = ["```json", "```JSON", "json```", "```"]
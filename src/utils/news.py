@@ -0,0 +1,13 @@
+import re
+
+
+# Headline keywords that mark a news item as negative
+NEGATIVE_KEYWORDS = ("lawsuit", "fraud", "negative", "downturn", "decline", "investigation", "recall")
+# Matches any keyword in a single pass; applied to the lowercased headline so it matches exactly what a
+# substring check on title.lower() would
+NEGATIVE_KEYWORDS_RE = re.compile("|".join(map(re.escape, NEGATIVE_KEYWORDS)))
+
+
+def is_negative_headline(title: str | None) -> bool:
+    """Return True if the headline mentions any of the negative keywords, ignoring case."""
+    return NEGATIVE_KEYWORDS_RE.search((title or "").lower()) is not None
@@ -1,6 +1,7 @@
 """Utilities for working with Ollama models"""
 
 import platform
+import re
 import subprocess
 import requests
 import time
@@ -13,6 +14,13 @@ from . import docker
 # Constants
 DEFAULT_OLLAMA_SERVER_URL = "http://localhost:11434"
 
+# Patterns for parsing `ollama pull` progress lines
+_PULL_PERCENTAGE_RE = re.compile(r"(\d+(\.\d+)?)%")
+_PULL_PHASE_RE = re.compile(r"^([a-zA-Z\s]+):")
+
+# Shared session so repeated server checks reuse one keep-alive connection
+_session = requests.Session()
+
 
 def _get_ollama_base_url() -> str:
     """Return the configured Ollama base URL, trimming any trailing slash."""
@@ -58,7 +66,7 @@ def is_ollama_server_running() -> bool:
     """Check if the Ollama server is running."""
     endpoint = _get_ollama_endpoint("/api/tags")
     try:
-        response = requests.get(endpoint, timeout=2)
+        response = _session.get(endpoint, timeout=2)
         return response.status_code == 200
     except requests.RequestException:
         return False
@@ -71,7 +79,7 @@ def get_locally_available_models() -> List[str]:
 
     try:
         endpoint = _get_ollama_endpoint("/api/tags")
-        response = requests.get(endpoint, timeout=5)
+        response = _session.get(endpoint, timeout=5)
         if response.status_code == 200:
             data = response.json()
             return [model["name"] for model in data["models"]] if "models" in data else []
@@ -250,9 +258,7 @@ def download_model(model_name: str) -> bool:
                 # "pulling manifest: 100%"
 
                 # Check for percentage in the output
-                import re
-
-                percentage_match = re.search(r"(\d+(\.\d+)?)%", output)
+                percentage_match = _PULL_PERCENTAGE_RE.search(output)
                 if percentage_match:
                     try:
                         percentage = float(percentage_match.group(1))
@@ -260,7 +266,7 @@ def download_model(model_name: str) -> bool:
                         percentage = None
 
                 # Try to determine the current phase (downloading, extracting, etc.)
-                phase_match = re.search(r"^([a-zA-Z\s]+):", output)
+                phase_match = _PULL_PHASE_RE.search(output)
                 if phase_match:
                     current_phase = phase_match.group(1).strip()
 
@@ -284,7 +290,8 @@ def download_model(model_name: str) -> bool:
                         print(status_line, end="", flush=True)
                 else:
                     # If we couldn't extract a percentage but have identifiable output
-                    if "download" in output.lower() or "extract" in output.lower() or "pulling" in output.lower():
+                    output_lower = output.lower()
+                    if "download" in output_lower or "extract" in output_lower or "pulling" in output_lower:
                         # Don't print a newline for percentage updates
                         if "%" in output:
                             print(f"\r{Fore.GREEN}{output}{Style.RESET_ALL}", end="", flush=True)
@@ -1,4 +1,6 @@
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -9,6 +11,22 @@ from typing import Dict, Optional, Callable, List
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _utc_second_prefix(epoch_seconds: int) -> str:
+    """Format the date and time part of a UTC timestamp, reused for every update within the same second."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time in ISO 8601 format with microsecond precision.
+
+    Unlike datetime.isoformat(), the six microsecond digits are always written, even when
+    they are all zero, so timestamps have a fixed width and sort correctly as strings.
+    """
+    epoch_seconds, microseconds = divmod(time.time_ns() // 1000, 1_000_000)
+    return f"{_utc_second_prefix(epoch_seconds)}.{microseconds:06d}+00:00"
+
+
 class AgentProgress:
     """Manages progress tracking for multiple agents."""
 
@@ -32,8 +50,10 @@ class AgentProgress:
     def start(self):
         """Start the progress display."""
         if not self.started:
-            self.live.start()
+            # Updates made while stopped skip the redraw, so build the table before showing it
             self.started = True
+            self._refresh_display()
+            self.live.start()
 
     def stop(self):
         """Stop the progress display."""
@@ -54,7 +74,7 @@ class AgentProgress:
             self.agent_status[agent_name]["analysis"] = analysis
         
         # Set the timestamp as UTC datetime
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = utc_timestamp()
         self.agent_status[agent_name]["timestamp"] = timestamp
 
         # Notify all registered handlers
@@ -73,6 +93,11 @@ class AgentProgress:
 
     def _refresh_display(self):
         """Refresh the progress display."""
+        # Nothing is shown until start(), e.g. when running behind the web backend,
+        # so don't rebuild the styled table for every update
+        if not self.started:
+            return
+
         self.table.columns.clear()
         self.table.add_column(width=100)
 
@@ -89,11 +114,12 @@ class AgentProgress:
         for agent_name, info in sorted(self.agent_status.items(), key=sort_key):
             status = info["status"]
             ticker = info["ticker"]
-            # Create the status text with appropriate styling
-            if status.lower() == "done":
+            # Create the status text with appropriate styling, case-folding the status only once
+            status_lower = status.lower()
+            if status_lower == "done":
                 style = Style(color="green", bold=True)
                 symbol = "✓"
-            elif status.lower() == "error":
+            elif status_lower == "error":
                 style = Style(color="red", bold=True)
                 symbol = "✗"
             else:
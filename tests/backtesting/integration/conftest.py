@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -27,11 +28,16 @@ def _find_price_fixture_file(ticker: str, start: str, end: str) -> Path | None:
     return None
 
 
-def _load_price_df_from_fixture(ticker: str, start: str, end: str) -> pd.DataFrame:
-    fixture_path = _find_price_fixture_file(ticker, start, end)
-    assert fixture_path is not None, f"Missing price fixture for {ticker} covering {start}..{end}"
+@lru_cache(maxsize=None)
+def _read_fixture(fixture_path: Path) -> dict:
+    # Fixture files are read-only, so parse each once for the whole session
     with fixture_path.open("r") as f:
-        data = json.load(f)
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _price_df_from_fixture_file(fixture_path: Path) -> pd.DataFrame:
+    data = _read_fixture(fixture_path)
     # Build DataFrame similar to prices_to_df output
     df = pd.DataFrame([p for p in data["prices"]])
     df["Date"] = pd.to_datetime(df["time"]).dt.tz_convert('UTC')  # align with prices_to_df index name
@@ -39,7 +45,14 @@ def _load_price_df_from_fixture(ticker: str, start: str, end: str) -> pd.DataFra
     for col in ("open", "close", "high", "low", "volume"):
         df[col] = pd.to_numeric(df[col], errors="coerce")
     df.sort_index(inplace=True)
-    # Filter by requested window
+    return df
+
+
+def _load_price_df_from_fixture(ticker: str, start: str, end: str) -> pd.DataFrame:
+    fixture_path = _find_price_fixture_file(ticker, start, end)
+    assert fixture_path is not None, f"Missing price fixture for {ticker} covering {start}..{end}"
+    df = _price_df_from_fixture_file(fixture_path)
+    # Filter by requested window (boolean indexing returns a copy, leaving the cached frame untouched)
     start_ts = pd.to_datetime(start).tz_localize('UTC')
     end_ts = pd.to_datetime(end).tz_localize('UTC')
     df = df.loc[(df.index >= start_ts) & (df.index <= end_ts)]
@@ -63,8 +76,7 @@ def _find_fm_fixture_file(ticker: str, end: str) -> Path | None:
 def _load_financial_metrics_from_fixture(ticker: str, end: str, limit: int) -> list[dict]:
     fixture_path = _find_fm_fixture_file(ticker, end)
     assert fixture_path is not None, f"Missing financial metrics fixture for {ticker} covering ..{end}"
-    with fixture_path.open("r") as f:
-        data = json.load(f)
+    data = _read_fixture(fixture_path)
     # data should match FinancialMetricsResponse
     items = data.get("financial_metrics", [])
     # Mimic API limit behavior
@@ -83,8 +95,7 @@ def _load_news_from_fixture(ticker: str, start: str | None, end: str, limit: int
             if len(parts) >= 3 and parts[1] <= end <= parts[2]:
                 fixture_path = p
                 break
-    with fixture_path.open("r") as f:
-        data = json.load(f)
+    data = _read_fixture(fixture_path)
     items = data.get("news", [])
     return items[:limit]
 
@@ -98,8 +109,7 @@ def _load_insider_from_fixture(ticker: str, start: str | None, end: str, limit:
             if len(parts) >= 3 and parts[1] <= end <= parts[2]:
                 fixture_path = p
                 break
-    with fixture_path.open("r") as f:
-        data = json.load(f)
+    data = _read_fixture(fixture_path)
     items = data.get("insider_trades", [])
     return items[:limit]
 
@@ -0,0 +1,169 @@
+import json
+import os
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.data.cache import Cache
+from src.tools.api import get_prices, search_line_items
+
+
+def _line_items_response():
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps({
+        "search_results": [
+            {
+                "ticker": "AAPL",
+                "report_period": "2024-09-28",
+                "period": "ttm",
+                "currency": "USD",
+                "net_income": 93736000000.0,
+                "free_cash_flow": 108807000000.0,
+            }
+        ]
+    }).encode()
+    return response
+
+
+class TestLineItemCaching:
+    """Test suite for line item search caching."""
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api._make_api_request')
+    def test_repeat_search_is_served_from_cache(self, mock_request, mock_cache):
+        """Test that an identical line item search only hits the API once."""
+        mock_request.return_value = _line_items_response()
+
+        with patch.dict(os.environ, {"FINANCIAL_DATASETS_API_KEY": "test-key"}):
+            first = search_line_items("AAPL", ["net_income", "free_cash_flow"], "2024-12-31")
+            # Same line items in a different order share the cache entry
+            second = search_line_items("AAPL", ["free_cash_flow", "net_income"], "2024-12-31")
+
+        assert mock_request.call_count == 1
+        assert len(second) == 1
+        assert second[0].model_dump() == first[0].model_dump()
+        assert second[0].net_income == 93736000000.0
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api._make_api_request')
+    def test_different_parameters_miss_cache(self, mock_request, mock_cache):
+        """Test that searches with different parameters are fetched separately."""
+        mock_request.return_value = _line_items_response()
+
+        with patch.dict(os.environ, {"FINANCIAL_DATASETS_API_KEY": "test-key"}):
+            search_line_items("AAPL", ["net_income"], "2024-12-31")
+            search_line_items("AAPL", ["net_income"], "2024-12-31", period="annual")
+
+        assert mock_request.call_count == 2
+
+
+@pytest.fixture(scope="module")
+def prices_content() -> bytes:
+    # Serialized once for the module; bytes are immutable so tests can't leak state through it
+    return json.dumps({
+        "ticker": "AAPL",
+        "prices": [
+            {"open": 1.0, "close": float(day), "high": 3.0, "low": 0.5, "volume": 100, "time": f"2024-03-{day:02d}T05:00:00Z"}
+            for day in range(1, 9)
+        ],
+    }).encode()
+
+
+class TestPriceRangeCaching:
+    """Test suite for serving price windows from a cached range."""
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api._make_api_request')
+    def test_window_inside_cached_range_skips_api(self, mock_request, mock_cache, prices_content):
+        """Test that a daily window within a prefetched range is sliced from the cache."""
+        mock_request.return_value = Mock(status_code=200, content=prices_content)
+
+        get_prices("AAPL", "2024-03-01", "2024-03-08")
+        window = get_prices("AAPL", "2024-03-04", "2024-03-05")
+
+        assert mock_request.call_count == 1
+        assert [p.close for p in window] == [4.0, 5.0]
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api._make_api_request')
+    def test_window_reaching_range_end_is_fetched(self, mock_request, mock_cache, prices_content):
+        """Test that a window ending on the cached range's last day is fetched from the API."""
+        mock_request.return_value = Mock(status_code=200, content=prices_content)
+
+        get_prices("AAPL", "2024-03-01", "2024-03-08")
+        get_prices("AAPL", "2024-03-07", "2024-03-08")
+
+        assert mock_request.call_count == 2
+
+
+class TestConcurrentFetchCoalescing:
+    """Test suite for coalescing concurrent identical fetches."""
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api._make_api_request')
+    def test_concurrent_identical_requests_share_one_fetch(self, mock_request, mock_cache):
+        """Test that concurrent cache misses for the same prices trigger a single API call."""
+        def slow_response(*args, **kwargs):
+            time.sleep(0.1)
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({
+                "ticker": "AAPL",
+                "prices": [
+                    {"open": 1.0, "close": 2.0, "high": 3.0, "low": 0.5, "volume": 100, "time": "2024-01-02"}
+                ],
+            }).encode()
+            return response
+
+        mock_request.side_effect = slow_response
+        results = []
+
+        def fetch():
+            results.append(get_prices("AAPL", "2024-01-01", "2024-01-31"))
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_request.call_count == 1
+        assert len(results) == 5
+        assert all(len(prices) == 1 and prices[0].close == 2.0 for prices in results)
+
+    @patch('src.tools.api._cache', new_callable=Cache)
+    @patch('src.tools.api._make_api_request')
+    def test_failed_fetch_is_not_remembered(self, mock_request, mock_cache):
+        """Test that an error is raised to the caller and the next call fetches again."""
+        error_response = Mock()
+        error_response.status_code = 500
+        error_response.text = "Internal Server Error"
+        mock_request.return_value = error_response
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="Error fetching data"):
+                get_prices("AAPL", "2024-01-01", "2024-01-31")
+
+        assert mock_request.call_count == 2
+
+
+class TestCacheMerge:
+    """Test suite for merging data into the cache."""
+
+    def test_recaching_known_records_adds_no_duplicates(self):
+        """Test that merging records already held by key only appends the new ones."""
+        cache = Cache()
+        prices = [{"time": "2024-01-02", "close": 2.0}, {"time": "2024-01-03", "close": 3.0}]
+
+        cache.set_prices("AAPL", prices)
+        cache.set_prices("AAPL", [dict(record) for record in prices])
+        assert cache.get_prices("AAPL") == prices
+
+        cache.set_prices("AAPL", [{"time": "2024-01-03", "close": 3.0}, {"time": "2024-01-04", "close": 4.0}])
+        assert [record["time"] for record in cache.get_prices("AAPL")] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 from unittest.mock import Mock, patch, call
@@ -8,7 +9,7 @@ class TestRateLimiting:
     """Test suite for API rate limiting functionality."""
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_handles_single_rate_limit(self, mock_get, mock_sleep):
         """Test that API retries once after a 429 and succeeds."""
         # Setup mock responses: first 429, then 200
@@ -31,7 +32,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called twice
+        # Verify session.get was called twice
         assert mock_get.call_count == 2
         mock_get.assert_has_calls([
             call(url, headers=headers),
@@ -42,7 +43,26 @@ class TestRateLimiting:
         mock_sleep.assert_called_once_with(60)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
+    def test_honors_retry_after_header(self, mock_get, mock_sleep):
+        """Test that the wait before retrying comes from Retry-After when the server sends it."""
+        mock_429_response = Mock()
+        mock_429_response.status_code = 429
+        mock_429_response.headers = {"Retry-After": "5"}
+
+        mock_200_response = Mock()
+        mock_200_response.status_code = 200
+
+        mock_get.side_effect = [mock_429_response, mock_200_response]
+
+        result = _make_api_request("https://api.financialdatasets.ai/test", {"X-API-KEY": "test-key"})
+
+        assert result.status_code == 200
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once_with(5.0)
+
+    @patch('src.tools.api.time.sleep')
+    @patch('src.tools.api._session.get')
     def test_handles_multiple_rate_limits(self, mock_get, mock_sleep):
         """Test that API retries multiple times after 429s."""
         # Setup mock responses: three 429s, then 200
@@ -70,7 +90,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.get was called 4 times
+        # Verify session.get was called 4 times
         assert mock_get.call_count == 4
         
         # Verify sleep was called 3 times with linear backoff: 60s, 90s, 120s
@@ -79,7 +99,7 @@ class TestRateLimiting:
         mock_sleep.assert_has_calls(expected_calls)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.post')
+    @patch('src.tools.api._session.post')
     def test_handles_post_rate_limiting(self, mock_post, mock_sleep):
         """Test that POST requests handle rate limiting."""
         # Setup mock responses: first 429, then 200
@@ -103,7 +123,7 @@ class TestRateLimiting:
         assert result.status_code == 200
         assert result.text == "Success"
         
-        # Verify requests.post was called twice
+        # Verify session.post was called twice
         assert mock_post.call_count == 2
         mock_post.assert_has_calls([
             call(url, headers=headers, json=json_data),
@@ -113,43 +133,20 @@ class TestRateLimiting:
         # Verify sleep was called once with 60 seconds (first retry)
         mock_sleep.assert_called_once_with(60)
 
+    @pytest.mark.parametrize("status_code, text", [
+        (500, "Internal Server Error"),
+        (200, "Success"),
+    ])
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
-    def test_ignores_other_errors(self, mock_get, mock_sleep):
-        """Test that non-429 errors are returned without retrying."""
-        # Setup mock response: 500 error
-        mock_500_response = Mock()
-        mock_500_response.status_code = 500
-        mock_500_response.text = "Internal Server Error"
-        
-        mock_get.return_value = mock_500_response
-        
-        # Call the function
-        headers = {"X-API-KEY": "test-key"}
-        url = "https://api.financialdatasets.ai/test"
-        
-        result = _make_api_request(url, headers)
-        
-        # Verify behavior
-        assert result.status_code == 500
-        assert result.text == "Internal Server Error"
-        
-        # Verify requests.get was called only once
-        assert mock_get.call_count == 1
-        
-        # Verify sleep was never called
-        mock_sleep.assert_not_called()
-
-    @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
-    def test_normal_success_requests(self, mock_get, mock_sleep):
-        """Test that successful requests return immediately without retry."""
-        # Setup mock response: 200 success
-        mock_200_response = Mock()
-        mock_200_response.status_code = 200
-        mock_200_response.text = "Success"
+    @patch('src.tools.api._session.get')
+    def test_non_rate_limited_responses_return_immediately(self, mock_get, mock_sleep, status_code, text):
+        """Test that successful and non-429 error responses are returned without retrying."""
+        # Setup mock response
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.text = text
         
-        mock_get.return_value = mock_200_response
+        mock_get.return_value = mock_response
         
         # Call the function
         headers = {"X-API-KEY": "test-key"}
@@ -158,10 +155,10 @@ class TestRateLimiting:
         result = _make_api_request(url, headers)
         
         # Verify behavior
-        assert result.status_code == 200
-        assert result.text == "Success"
+        assert result.status_code == status_code
+        assert result.text == text
         
-        # Verify requests.get was called only once
+        # Verify session.get was called only once
         assert mock_get.call_count == 1
         
         # Verify sleep was never called
@@ -169,7 +166,7 @@ class TestRateLimiting:
 
     @patch('src.tools.api._cache')
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_full_integration(self, mock_get, mock_sleep, mock_cache):
         """Test that get_prices function properly handles rate limiting."""
         # Mock cache to return None (cache miss)
@@ -181,7 +178,7 @@ class TestRateLimiting:
         
         mock_200_response = Mock()
         mock_200_response.status_code = 200
-        mock_200_response.json.return_value = {
+        mock_200_response.content = json.dumps({
             "ticker": "AAPL",
             "prices": [
                 {
@@ -193,7 +190,7 @@ class TestRateLimiting:
                     "volume": 1000
                 }
             ]
-        }
+        }).encode()
         
         mock_get.side_effect = [mock_429_response, mock_200_response]
         
@@ -216,7 +213,7 @@ class TestRateLimiting:
         mock_cache.set_prices.assert_called_once()
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_max_retries_exceeded(self, mock_get, mock_sleep):
         """Test that function stops retrying after max_retries and returns final 429."""
         # Setup mock responses: all 429s (exceeds max retries)
@@ -236,7 +233,7 @@ class TestRateLimiting:
         assert result.status_code == 429
         assert result.text == "Too Many Requests"
         
-        # Verify requests.get was called 3 times (1 initial + 2 retries)
+        # Verify session.get was called 3 times (1 initial + 2 retries)
         assert mock_get.call_count == 3
         
         # Verify sleep was called 2 times with linear backoff: 60s, 90s
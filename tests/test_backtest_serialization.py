@@ -0,0 +1,47 @@
+import json
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.backend.routes import hedge_fund
+from app.backend.routes.hedge_fund import _dumps_day_result
+
+
+@pytest.fixture()
+def day_result() -> dict:
+    return {
+        "date": "2024-01-02",
+        "trade_date": date(2024, 1, 2),
+        "generated_at": datetime(2024, 1, 2, 16, 30, 5),
+        "portfolio_value": 100123.45,
+        "portfolio_return": np.float64(0.12345),
+        "performance_metrics": {"sharpe_ratio": 1.5, "max_drawdown": None},
+        "current_prices": {"AAPL": 185.64},
+        "ticker_details": [{"ticker": "AAPL", "quantity": 10, "price": 185.64}],
+    }
+
+
+class TestDumpsDayResult:
+    """Test suite for serializing streamed backtest day results."""
+
+    def test_stdlib_fallback_encodes_dates(self, day_result, monkeypatch):
+        """Test that the stdlib fallback encodes floats and dates when orjson is unavailable."""
+        monkeypatch.setattr(hedge_fund, "orjson", None)
+
+        decoded = json.loads(_dumps_day_result(day_result))
+
+        assert decoded["trade_date"] == "2024-01-02"
+        assert decoded["generated_at"] == "2024-01-02T16:30:05"
+        assert decoded["portfolio_value"] == 100123.45
+        assert decoded["portfolio_return"] == 0.12345
+
+    def test_orjson_and_fallback_produce_same_json(self, day_result, monkeypatch):
+        """Test that both serializers decode to the same value."""
+        pytest.importorskip("orjson")
+        with_orjson = json.loads(_dumps_day_result(day_result))
+
+        monkeypatch.setattr(hedge_fund, "orjson", None)
+        with_stdlib = json.loads(_dumps_day_result(day_result))
+
+        assert with_orjson == with_stdlib
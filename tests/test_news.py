@@ -0,0 +1,20 @@
+import pytest
+
+from src.utils.news import is_negative_headline
+
+
+class TestNegativeHeadline:
+    """Test suite for the negative headline keyword check."""
+
+    @pytest.mark.parametrize("title, expected", [
+        ("Company faces LAWSUIT over patents", True),
+        ("Regulators open investigation", True),
+        ("Record quarter for sales", False),
+        ("", False),
+        (None, False),
+        # Only plain lowercasing applies, so Unicode case-folding variants don't match
+        ("Lawſuit filed", False),
+    ])
+    def test_matches_lowercased_substring_check(self, title, expected):
+        """Test that the check matches a keyword substring search on the lowercased title."""
+        assert is_negative_headline(title) is expected
@@ -0,0 +1,20 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.progress import utc_timestamp
+
+
+class TestUtcTimestamp:
+    """Test suite for progress update timestamps."""
+
+    @pytest.mark.parametrize("time_ns, expected", [
+        (1_704_164_645_123_456_789, "2024-01-02T03:04:05.123456+00:00"),
+        # Whole seconds keep the six zero digits that datetime.isoformat() would drop
+        (1_704_164_645_000_000_000, "2024-01-02T03:04:05.000000+00:00"),
+        (1_704_164_645_000_001_999, "2024-01-02T03:04:05.000001+00:00"),
+    ])
+    def test_fixed_width_format(self, time_ns, expected):
+        """Test that timestamps always carry six microsecond digits and a UTC offset."""
+        with patch("src.utils.progress.time.time_ns", return_value=time_ns):
+            assert utc_timestamp() == expected
@@ -0,0 +1,42 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.backend.main import RequestBodySizeLimitMiddleware
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestBodySizeLimitMiddleware, max_body_size=16)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    return TestClient(app)
+
+
+class TestRequestBodySizeLimit:
+    """Test suite for rejecting oversized request bodies."""
+
+    def test_body_within_limit_is_accepted(self, client):
+        """Test that a body at the limit reaches the route."""
+        response = client.post("/echo", content=b"x" * 16)
+
+        assert response.status_code == 200
+        assert response.json() == {"size": 16}
+
+    def test_declared_oversized_body_is_rejected(self, client):
+        """Test that a Content-Length over the limit is rejected with a 413."""
+        response = client.post("/echo", content=b"x" * 17)
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Request body too large"}
+
+    def test_streamed_oversized_body_is_rejected(self, client):
+        """Test that a body sent without Content-Length is counted as it is received."""
+        response = client.post("/echo", content=iter([b"x" * 10, b"x" * 10]))
+
+        assert response.status_code == 413
+        assert response.json() == {"detail": "Request body too large"}
@@ -0,0 +1,50 @@
+import asyncio
+import stat
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+
+from app.backend.routes import storage
+from app.backend.routes.storage import SaveJsonRequest, save_json_file
+
+
+@pytest.fixture()
+def outputs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "OUTPUTS_DIR", tmp_path)
+    return tmp_path
+
+
+class TestSaveJsonFile:
+    """Test suite for saving JSON outputs."""
+
+    def test_new_file_uses_umask_mode_without_touching_umask(self, outputs_dir, monkeypatch):
+        """Test that a new file gets the import-time umask mode and the process umask is left alone."""
+        monkeypatch.setattr(storage, "_FILE_MODE", 0o640)
+        monkeypatch.setattr(storage.os, "umask", Mock(side_effect=AssertionError("umask changed")))
+
+        asyncio.run(save_json_file(SaveJsonRequest(filename="result.json", data={"a": 1})))
+
+        saved = outputs_dir / "result.json"
+        assert saved.read_text(encoding="utf-8") == '{\n  "a": 1\n}'
+        assert stat.S_IMODE(saved.stat().st_mode) == 0o640
+
+    def test_overwrite_keeps_existing_mode(self, outputs_dir):
+        """Test that replacing an existing file keeps the permissions it already had."""
+        saved = outputs_dir / "result.json"
+        saved.write_text("{}", encoding="utf-8")
+        saved.chmod(0o600)
+
+        asyncio.run(save_json_file(SaveJsonRequest(filename="result.json", data={"a": 1})))
+
+        assert saved.read_text(encoding="utf-8") == '{\n  "a": 1\n}'
+        assert stat.S_IMODE(saved.stat().st_mode) == 0o600
+
+    def test_failed_write_leaves_no_temp_file(self, outputs_dir):
+        """Test that a write that fails part way removes its temp file and leaves no output."""
+        request = SaveJsonRequest(filename="result.json", data={"a": object()})
+
+        with pytest.raises(HTTPException):
+            asyncio.run(save_json_file(request))
+
+        assert list(outputs_dir.iterdir()) == []